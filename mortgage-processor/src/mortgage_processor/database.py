@@ -7,9 +7,10 @@ import os
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 import json
+import threading
 from contextlib import contextmanager
 
-from sqlalchemy import create_engine, Column, String, DateTime, Text, Integer, Boolean, ForeignKey, Float
+from sqlalchemy import bindparam, create_engine, select, Column, String, DateTime, Text, Integer, Boolean, ForeignKey, Float
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session, relationship
 from sqlalchemy.types import TypeDecorator, TEXT
@@ -240,3 +241,58 @@ def get_db_session():
         raise
     finally:
         session.close()
+
+
+# Status lookup statement built once, so each check only binds the id and reuses the compiled SQL
+_APPLICATION_BY_ID = select(MortgageApplicationDB).where(
+    MortgageApplicationDB.application_id == bindparam("application_id")
+)
+
+
+def get_application(db: Session, application_id: str) -> Optional[MortgageApplicationDB]:
+    """Get an application by id, or None if it does not exist"""
+    return db.execute(_APPLICATION_BY_ID, {"application_id": application_id}).scalar_one_or_none()
+
+
+# Group commit for application submissions: concurrent submitters queue their rows and
+# whichever thread takes the commit lock first writes everything pending in one transaction
+_pending_applications: List[Dict[str, Any]] = []
+_pending_lock = threading.Lock()
+_commit_lock = threading.Lock()
+
+
+def _insert_applications(applications: List[MortgageApplicationDB]) -> None:
+    """Insert applications in a single transaction"""
+    with get_db_session() as db:
+        db.add_all(applications)
+        db.commit()
+
+
+def save_application(application: MortgageApplicationDB) -> None:
+    """Insert a submitted application, sharing the commit with any concurrent submissions"""
+    entry = {"application": application, "done": False, "error": None}
+    with _pending_lock:
+        _pending_applications.append(entry)
+    
+    with _commit_lock:
+        if not entry["done"]:
+            with _pending_lock:
+                batch = _pending_applications[:]
+                _pending_applications.clear()
+            try:
+                _insert_applications([item["application"] for item in batch])
+            except Exception as e:
+                if len(batch) == 1:
+                    entry["error"] = e
+                else:
+                    # One bad row fails the whole batch, so fall back to row-by-row inserts
+                    for item in batch:
+                        try:
+                            _insert_applications([item["application"]])
+                        except Exception as row_error:
+                            item["error"] = row_error
+            for item in batch:
+                item["done"] = True
+    
+    if entry["error"] is not None:
+        raise entry["error"]
@@ -3,6 +3,8 @@ Node functions for the mortgage application LangGraph
 Contains the core node logic for assistant and data agents
 """
 
+import functools
+from string import Template
 from typing import Dict, Any, Literal
 from langchain_core.messages import SystemMessage, AIMessage
 from mortgage_processor.utils.llm_factory import get_llm, get_supervisor_llm, get_agent_llm, get_grader_llm
@@ -23,49 +25,60 @@ from .tools import (
 # Import state schemas from state.py
 from .state import AssistantAgentState, DataAgentState
 
+# Combined tools from ReactAgent + InfoAgent capabilities
+_ASSISTANT_TOOLS = (
+    generate_contextual_prompts,
+    generate_next_step_guidance,
+    analyze_application_state
+    # Note: Handoff tools will be provided automatically by supervisor
+)
 
-def assistant_agent_node(state: AssistantAgentState) -> Dict[str, Any]:
+# Data collection tools + database tools
+_DATA_TOOLS = (
+    extract_personal_info,
+    extract_employment_info,
+    extract_property_info,
+    extract_financial_info,
+    analyze_application_state,
+    # Database tools for agentic submission
+    submit_application_to_database,
+    check_application_status
+    # Note: Handoff tools will be provided automatically by supervisor
+)
+
+# The 11 fields required before an application can be submitted
+_COMPLETION_FIELDS = (
+    "full_name", "phone", "email",
+    "annual_income", "employer", "employment_type",
+    "purchase_price", "property_type", "property_location",
+    "down_payment", "credit_score"
+)
+
+
+def _completion(state) -> tuple[tuple, float, bool]:
     """
-    AssistantAgent unified agent for guidance, education, and UI prompts
-    Combines ReactAgent and InfoAgent responsibilities without duplication
+    Return (field values, completion percentage, is_complete) for the 11 required fields.
+    Reuses the result stashed on state by the previous node when the values are unchanged.
     """
-    # Use centralized LLM factory - all config comes from config.yaml
-    llm = get_agent_llm()
-    
-    # Combined tools from ReactAgent + InfoAgent capabilities
-    tools = [
-        generate_contextual_prompts,
-        generate_next_step_guidance,
-        analyze_application_state
-        # Note: Handoff tools will be provided automatically by supervisor
-    ]
-    
-    llm_with_tools = llm.bind_tools(tools)
-    
-    # Get conversation context from specialized state
-    topics_discussed = state.get("topics_discussed", [])
-    user_expertise = state.get("user_expertise_level", "beginner")
-    ui_context = state.get("ui_context", "initial")
-    
-    # Check completion status to provide appropriate guidance
-    collected_fields = [
-        state.get("full_name"), state.get("phone"), state.get("email"),
-        state.get("annual_income"), state.get("employer"), state.get("employment_type"),
-        state.get("purchase_price"), state.get("property_type"), state.get("property_location"),
-        state.get("down_payment"), state.get("credit_score")
-    ]
-    is_complete = all(field is not None and field != "" for field in collected_fields)
-    completion_status = "COMPLETE - Ready for submission" if is_complete else "IN PROGRESS - Collecting data"
+    vals = tuple(state.get(field) for field in _COMPLETION_FIELDS)
+    key = hash(vals)
+    if state.get("_completion_cache_key") == key and state.get("_completion_cache"):
+        return state["_completion_cache"]
     
-    system_prompt = f"""You are an AssistantAgent that provides comprehensive help, guidance, and education.
+    pct = (sum(1 for field in vals if field) / len(vals)) * 100
+    is_complete = all(field is not None and field != "" for field in vals)
+    return vals, pct, is_complete
+
+
+_ASSISTANT_TEMPLATE = Template("""You are an AssistantAgent that provides comprehensive help, guidance, and education.
 
 YOUR UNIFIED MISSION: Help users with mortgage applications through guidance, education, and UI assistance.
 
 CONVERSATION CONTEXT:
-- Topics Previously Discussed: {', '.join(topics_discussed) if topics_discussed else 'None'}
-- User Expertise Level: {user_expertise}
-- Current UI Context: {ui_context}
-- Application Status: {completion_status}
+- Topics Previously Discussed: $topics
+- User Expertise Level: $user_expertise
+- Current UI Context: $ui_context
+- Application Status: $completion_status
 
 YOUR CAPABILITIES:
 1. GUIDANCE & NEXT STEPS:
@@ -107,8 +120,8 @@ COMPLETION HANDLING:
 
 ABSOLUTELY CRITICAL - NEVER SHOW THESE TO USERS:
  Tool calls: [generate_contextual_prompts(...)]
- JSON: {{"type": "prompts"}}
- Technical syntax: (), [], {{}}
+ JSON: {"type": "prompts"}
+ Technical syntax: (), [], {}
  Agent names: [Agent: AssistantAgent]
  System messages or internal processing
 
@@ -134,9 +147,41 @@ CORRECT RESPONSE EXAMPLES:
 
 NEVER INCLUDE TOOL SYNTAX IN YOUR RESPONSE TEXT.
 
-YOUR STYLE: Friendly, educational, and action-oriented. Combine mortgage expertise with practical guidance."""
+YOUR STYLE: Friendly, educational, and action-oriented. Combine mortgage expertise with practical guidance.""")
 
-    messages = [SystemMessage(content=system_prompt)] + state["messages"]
+
+@functools.lru_cache(maxsize=256)
+def _assistant_sysmsg(ui_context: str, expertise: str, topics_key: tuple, is_complete: bool) -> SystemMessage:
+    """Build the AssistantAgent system prompt once per distinct conversation context"""
+    return SystemMessage(content=_ASSISTANT_TEMPLATE.substitute(
+        topics=', '.join(topics_key) if topics_key else 'None',
+        user_expertise=expertise,
+        ui_context=ui_context,
+        completion_status="COMPLETE - Ready for submission" if is_complete else "IN PROGRESS - Collecting data"
+    ))
+
+
+def assistant_agent_node(state: AssistantAgentState) -> Dict[str, Any]:
+    """
+    AssistantAgent unified agent for guidance, education, and UI prompts
+    Combines ReactAgent and InfoAgent responsibilities without duplication
+    """
+    # Use centralized LLM factory - all config comes from config.yaml
+    llm = get_agent_llm()
+    
+    llm_with_tools = llm.bind_tools(list(_ASSISTANT_TOOLS))
+    
+    # Get conversation context from specialized state
+    topics_discussed = state.get("topics_discussed", [])
+    user_expertise = state.get("user_expertise_level", "beginner")
+    ui_context = state.get("ui_context", "initial")
+    
+    # Check completion status to provide appropriate guidance
+    completion = _completion(state)
+    is_complete = completion[2]
+    system_message = _assistant_sysmsg(ui_context, user_expertise, tuple(sorted(topics_discussed)), is_complete)
+
+    messages = [system_message] + state["messages"]
     response = llm_with_tools.invoke(messages)
     
     # Create clean user-facing response (no technical indicators)
@@ -146,7 +191,11 @@ YOUR STYLE: Friendly, educational, and action-oriented. Combine mortgage experti
     )
     
     # Update state with conversation tracking and UI context
-    state_updates = {"messages": [clean_response]}
+    state_updates = {
+        "messages": [clean_response],
+        "_completion_cache_key": hash(completion[0]),
+        "_completion_cache": completion
+    }
     
     # Track what type of assistance was provided
     if hasattr(response, 'content') and response.content:
@@ -195,29 +244,11 @@ def data_agent_node(state: DataAgentState, config=None, *, store=None) -> Dict[s
     # Use centralized LLM factory - all config comes from config.yaml
     llm = get_llm()  # Use default settings for tool calling
     
-    # Data collection tools + database tools
-    tools = [
-        extract_personal_info,
-        extract_employment_info,
-        extract_property_info,
-        extract_financial_info,
-        analyze_application_state,
-        # Database tools for agentic submission
-        submit_application_to_database,
-        check_application_status
-        # Note: Handoff tools will be provided automatically by supervisor
-    ]
-    
-    llm_with_tools = llm.bind_tools(tools)
+    llm_with_tools = llm.bind_tools(list(_DATA_TOOLS))
     
     # Get completion status from current state
-    collected_fields = [
-        state.get("full_name"), state.get("phone"), state.get("email"),
-        state.get("annual_income"), state.get("employer"), state.get("employment_type"),
-        state.get("purchase_price"), state.get("property_type"), state.get("property_location"),
-        state.get("down_payment"), state.get("credit_score")
-    ]
-    completion_percentage = (sum(1 for field in collected_fields if field) / len(collected_fields)) * 100
+    completion = _completion(state)
+    completion_percentage = completion[1]
     
     is_complete = completion_percentage >= 95.0  # Consider complete when 95%+ collected
     
@@ -358,10 +389,7 @@ NEVER INCLUDE TOOL SYNTAX IN YOUR RESPONSE TEXT."""
         user_id = config.get("configurable", {}).get("user_id")
         if user_id:
             customer_data = {k: v for k, v in state.items() 
-                           if k in ["full_name", "phone", "email", "annual_income", 
-                                   "employer", "employment_type", "purchase_price", 
-                                   "property_type", "property_location", "down_payment", "credit_score"] 
-                           and v is not None}
+                           if k in _COMPLETION_FIELDS and v is not None}
             
             if customer_data:
                 namespace = (user_id, "data_agent_profile")
@@ -377,7 +405,9 @@ NEVER INCLUDE TOOL SYNTAX IN YOUR RESPONSE TEXT."""
     state_updates = {
         "messages": [clean_response],
         "completion_percentage": completion_percentage,
-        "data_extraction_attempts": state.get("data_extraction_attempts", 0) + 1
+        "data_extraction_attempts": state.get("data_extraction_attempts", 0) + 1,
+        "_completion_cache_key": hash(completion[0]),
+        "_completion_cache": completion
     }
     
     return state_updates
@@ -2,7 +2,7 @@
 State schema for the mortgage application workflow
 """
 
-from typing import Dict, List, Any, Annotated
+from typing import Dict, List, Any, Annotated, Tuple
 from typing_extensions import TypedDict, NotRequired
 from langchain_core.messages import BaseMessage
 from langgraph.graph import MessagesState
@@ -78,6 +78,10 @@ class AssistantAgentState(MessagesState):
     # Handoff context
     handoff_reason: NotRequired[str]
     
+    # Completion memo shared with DataAgent (see nodes._completion)
+    _completion_cache_key: NotRequired[int]
+    _completion_cache: NotRequired[Tuple[tuple, float, bool]]
+    
     # Required by create_react_agent
     remaining_steps: NotRequired[int]
 
@@ -106,6 +110,10 @@ class DataAgentState(MessagesState):
     # Handoff context
     handoff_reason: NotRequired[str]
     
+    # Completion memo shared with AssistantAgent (see nodes._completion)
+    _completion_cache_key: NotRequired[int]
+    _completion_cache: NotRequired[Tuple[tuple, float, bool]]
+    
     # Required by create_react_agent
     remaining_steps: NotRequired[int]
 
@@ -7,10 +7,12 @@ Organized by functional area for better maintainability
 from .core import (
     # Document processing tools
     classify_document_type,
+    classify_document_types,
     validate_document_expiration,
     extract_personal_information,
     extract_income_information,
     check_document_quality,
+    process_documents_batch,
     authorize_credit_check,
     generate_urla_1003_form,
     cross_validate_documents,
@@ -98,10 +100,12 @@ from .customer_service import (
 __all__ = [
     # Core tools
     "classify_document_type",
+    "classify_document_types",
     "validate_document_expiration", 
     "extract_personal_information",
     "extract_income_information",
     "check_document_quality",
+    "process_documents_batch",
     "authorize_credit_check",
     "generate_urla_1003_form",
     "cross_validate_documents",
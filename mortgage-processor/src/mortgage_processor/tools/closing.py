@@ -3,14 +3,201 @@ Closing tools for closing coordination and finalization
 Handles closing document preparation, coordination, and post-closing activities
 """
 
-import logging
-import uuid
+import functools
+import secrets
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from langchain_core.tools import tool
 import random
+from collections import Counter
+from types import MappingProxyType
 
-logger = logging.getLogger(__name__)
+# Day offsets used by the closing tools (-2 to 60), built once since timedelta is immutable
+_DAYS = {days: timedelta(days=days) for days in range(-2, 61)}
+
+# Closing document skeletons: (document, description, responsible_party, deadline_days, status)
+_BASE_DOCS = (
+    ("Closing Disclosure", "Final loan terms and closing costs", "Lender", 3, "In Preparation"),
+    ("Promissory Note", "Borrower's promise to repay the loan", "Lender", 5, "Not Started"),
+    ("Deed of Trust/Mortgage", "Security instrument for the loan", "Lender", 5, "Not Started"),
+    ("Title Insurance Policy", "Protection against title defects", "Title Company", 7, "Ordered"),
+    ("Property Insurance Binder", "Evidence of property insurance coverage", "Borrower", 1, "Pending"),
+    ("Final Walkthrough Report", "Property condition verification", "Real Estate Agent", 14, "Scheduled"),
+    ("Funding Authorization", "Authorization to fund the loan", "Lender", 14, "Pending Approval"),
+)
+_VA_DOC = ("VA Funding Fee Disclosure", "VA funding fee calculation and disclosure", "Lender", 3, "Not Started")
+_FHA_DOC = ("FHA Mortgage Insurance Disclosure", "FHA mortgage insurance requirements", "Lender", 3, "Not Started")
+
+# Title work skeletons: (component, description, status, completion_days, cost);
+# a cost of None is priced at 0.06% of the loan amount
+_TITLE_WORK = (
+    ("Title Search", "Research property ownership history", "In Progress", 5, 150.00),
+    ("Title Examination", "Review title search results for issues", "Pending", 7, 200.00),
+    ("Title Insurance Commitment", "Issue title insurance commitment", "Pending", 9, None),
+    ("Survey Review", "Review property survey for boundary issues", "Ordered", 10, 350.00),
+)
+
+# Escrow services do not depend on the request, so they are copied out per call
+_ESCROW_SERVICES = (
+    MappingProxyType({"service": "Escrow Account Setup", "description": "Establish neutral escrow account", "status": "Complete", "cost": 250.00}),
+    MappingProxyType({"service": "Document Preparation", "description": "Prepare closing and recording documents", "status": "In Progress", "cost": 300.00}),
+    MappingProxyType({"service": "Closing Coordination", "description": "Schedule and coordinate closing meeting", "status": "Pending", "cost": 150.00}),
+    MappingProxyType({"service": "Recording Services", "description": "Record documents with county recorder", "status": "Pending", "cost": 85.00}),
+)
+_ESCROW_COSTS = sum(service["cost"] for service in _ESCROW_SERVICES)
+_ESCROW_PROGRESS = sum(service["status"] == "Complete" for service in _ESCROW_SERVICES) / len(_ESCROW_SERVICES) * 100
+
+# Post-closing task skeletons: (task, description, responsible_party, due_days, status, priority);
+# a status of None reports the recording status supplied by the caller
+_POST_CLOSING_TASKS = (
+    ("Document Recording", "Record deed and mortgage with county recorder", "Title Company", 1, None, "Critical"),
+    ("Loan Funding Confirmation", "Confirm loan funds have been disbursed", "Lender", 0, "Complete", "Critical"),
+    ("Title Insurance Policy Issuance", "Issue final title insurance policy", "Title Company", 30, "Pending", "High"),
+    ("Loan Delivery to Investor", "Deliver loan package to secondary market investor", "Lender", 60, "Not Started", "High"),
+    ("Escrow Account Setup", "Establish escrow account for taxes and insurance", "Loan Servicer", 45, "In Progress", "Medium"),
+    ("Welcome Package to Borrower", "Send loan servicing information to borrower", "Loan Servicer", 10, "Scheduled", "Medium"),
+    ("Quality Control Review", "Post-closing quality control audit", "Lender", 30, "Scheduled", "Medium"),
+)
+
+# ID date stamps change once a day, so the last one is kept as [ordinal, "YYYYMMDD"]
+_id_date_cache = [-1, ""]
+
+
+def _make_id(prefix: str, now: datetime) -> str:
+    """Build a PREFIX_YYYYMMDD_XXXXXXXX identifier stamped with the given local time"""
+    day = now.toordinal()
+    if day != _id_date_cache[0]:
+        _id_date_cache[:] = [day, now.strftime('%Y%m%d')]
+    return f"{prefix}_{_id_date_cache[1]}_{secrets.token_hex(4).upper()}"
+
+
+# Participants who must attend the closing meeting
+_REQUIRED_ROLES = frozenset({"borrower", "seller", "title_officer"})
+
+# Closing meeting hours offered each weekday: (hour, ISO time suffix, display time)
+_SLOT_HOURS = (
+    (9, "T09:00:00", "09:00 AM"),
+    (10, "T10:00:00", "10:00 AM"),
+    (11, "T11:00:00", "11:00 AM"),
+    (14, "T14:00:00", "02:00 PM"),
+    (15, "T15:00:00", "03:00 PM"),
+    (16, "T16:00:00", "04:00 PM"),
+)
+
+# Weekday names indexed by datetime.weekday(), matching strftime('%A') in the default locale
+_WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Closing meeting locations, copied out per call
+_LOCATION_DETAILS = MappingProxyType({
+    "title_company": MappingProxyType({
+        "name": "Demo Title & Escrow Company",
+        "address": "123 Title Plaza, Suite 200, Anytown, ST 12345",
+        "phone": "(555) 123-4567",
+        "parking": "Free parking available",
+        "amenities": ("Conference room", "Notary services", "Document copies")
+    }),
+    "lender": MappingProxyType({
+        "name": "Demo Mortgage Lender",
+        "address": "456 Lending Lane, Financial District, Anytown, ST 12345",
+        "phone": "(555) 234-5678",
+        "parking": "Validated parking",
+        "amenities": ("Conference room", "Refreshments", "Wi-Fi")
+    }),
+    "attorney": MappingProxyType({
+        "name": "Demo Legal Services",
+        "address": "789 Law Street, Legal District, Anytown, ST 12345",
+        "phone": "(555) 345-6789",
+        "parking": "Street parking",
+        "amenities": ("Private office", "Notary services")
+    })
+})
+
+# Next steps after closing document preparation
+_PREP_NEXT_STEPS = (
+    "Complete Closing Disclosure preparation",
+    "Coordinate with title company for title insurance",
+    "Obtain borrower insurance binder",
+    "Schedule final walkthrough",
+    "Prepare loan documents for execution",
+)
+
+# Next actions after title and escrow coordination
+_TITLE_NEXT_ACTIONS = (
+    "Complete title search and examination",
+    "Resolve any title issues identified",
+    "Prepare title insurance commitment",
+    "Schedule closing date and time",
+    "Coordinate document signing",
+)
+
+# What every closing meeting requires of its participants
+_MEETING_REQUIREMENTS = (
+    "All participants must bring valid photo ID",
+    "Borrower must bring certified funds for closing costs",
+    "Final walkthrough must be completed before closing",
+    "All loan conditions must be satisfied",
+    "Insurance binder must be provided",
+)
+
+# Coordination reminders for the closing meeting
+_MEETING_NOTES = (
+    "Confirm all participants 24 hours before closing",
+    "Review closing disclosure with borrower before meeting",
+    "Ensure all documents are prepared and reviewed",
+    "Coordinate fund transfer timing",
+    "Plan for document recording after signing",
+)
+
+# Fallbacks offered when no meeting slot suits the participants
+_MEETING_BACKUP_OPTIONS = (
+    "Remote/mobile closing available",
+    "Evening appointments by special arrangement",
+    "Weekend closings for urgent situations",
+)
+
+# Simulated title issues
+_UNPAID_TAXES_ISSUE = MappingProxyType({
+    "issue": "Unpaid Property Taxes",
+    "description": "Outstanding property taxes must be paid at closing",
+    "severity": "Medium",
+    "resolution": "Calculate and collect tax prorations at closing"
+})
+_EASEMENT_ISSUE = MappingProxyType({
+    "issue": "Easement on Property",
+    "description": "Utility easement identified in title search",
+    "severity": "Low",
+    "resolution": "Verify easement doesn't affect property use"
+})
+
+# Title and escrow contacts
+_TITLE_CONTACTS = MappingProxyType({
+    "title_officer": "Jane Smith, Senior Title Officer",
+    "escrow_officer": "Bob Johnson, Escrow Officer",
+    "phone": "(555) 123-4567",
+    "email": "closing@demotitle.com"
+})
+
+# Documents delivered to the investor after closing
+_LOAN_DELIVERY_ITEMS = (
+    "Original promissory note",
+    "Recorded deed of trust/mortgage",
+    "Closing disclosure",
+    "Title insurance policy",
+    "Property appraisal",
+    "Income and employment verification",
+    "Credit report",
+    "Property insurance evidence",
+    "Compliance certifications",
+)
+
+# Next actions after post-closing coordination
+_POST_CLOSING_NEXT_ACTIONS = (
+    "Confirm document recording completion",
+    "Begin loan delivery package preparation",
+    "Schedule quality control review",
+    "Monitor critical task completion",
+    "Coordinate with loan servicer for borrower communications",
+)
 
 
 @tool
@@ -27,92 +214,54 @@ def prepare_closing_documents(loan_data: Dict[str, Any], property_data: Dict[str
     Returns:
         Closing document preparation status and checklist
     """
-    preparation_id = f"CLOSE_{datetime.now().strftime('%Y%m%d')}_{uuid.uuid4().hex[:8].upper()}"
+    now = datetime.now()
+    preparation_id = _make_id("CLOSE", now)
+    today = now.date()  # Deadlines are day-level
     
     if property_data is None:
         property_data = {}
     if borrower_data is None:
         borrower_data = {}
     
-    # Required closing documents
-    required_documents = [
-        {
-            "document": "Closing Disclosure",
-            "description": "Final loan terms and closing costs",
-            "responsible_party": "Lender",
-            "deadline": (datetime.now() + timedelta(days=3)).isoformat(),
-            "status": "In Preparation"
-        },
-        {
-            "document": "Promissory Note",
-            "description": "Borrower's promise to repay the loan",
-            "responsible_party": "Lender",
-            "deadline": (datetime.now() + timedelta(days=5)).isoformat(),
-            "status": "Not Started"
-        },
-        {
-            "document": "Deed of Trust/Mortgage",
-            "description": "Security instrument for the loan",
-            "responsible_party": "Lender",
-            "deadline": (datetime.now() + timedelta(days=5)).isoformat(),
-            "status": "Not Started"
-        },
-        {
-            "document": "Title Insurance Policy",
-            "description": "Protection against title defects",
-            "responsible_party": "Title Company",
-            "deadline": (datetime.now() + timedelta(days=7)).isoformat(),
-            "status": "Ordered"
-        },
-        {
-            "document": "Property Insurance Binder",
-            "description": "Evidence of property insurance coverage",
-            "responsible_party": "Borrower",
-            "deadline": (datetime.now() + timedelta(days=1)).isoformat(),
-            "status": "Pending"
-        },
-        {
-            "document": "Final Walkthrough Report",
-            "description": "Property condition verification",
-            "responsible_party": "Real Estate Agent",
-            "deadline": (datetime.now() + timedelta(days=14)).isoformat(),
-            "status": "Scheduled"
-        },
-        {
-            "document": "Funding Authorization",
-            "description": "Authorization to fund the loan",
-            "responsible_party": "Lender",
-            "deadline": (datetime.now() + timedelta(days=14)).isoformat(),
-            "status": "Pending Approval"
-        }
-    ]
-    
-    # Add loan-specific documents
+    # Required closing documents, plus loan-specific documents
     loan_type = loan_data.get("loan_type", "conventional")
+    templates = _BASE_DOCS
     if loan_type.lower() == "va":
-        required_documents.append({
-            "document": "VA Funding Fee Disclosure",
-            "description": "VA funding fee calculation and disclosure",
-            "responsible_party": "Lender",
-            "deadline": (datetime.now() + timedelta(days=3)).isoformat(),
-            "status": "Not Started"
-        })
+        templates += (_VA_DOC,)
     elif loan_type.lower() == "fha":
+        templates += (_FHA_DOC,)
+    
+    required_documents = []
+    critical_path_items = []
+    for document, description, responsible_party, days, status in templates:
         required_documents.append({
-            "document": "FHA Mortgage Insurance Disclosure",
-            "description": "FHA mortgage insurance requirements",
-            "responsible_party": "Lender",
-            "deadline": (datetime.now() + timedelta(days=3)).isoformat(),
-            "status": "Not Started"
+            "document": document,
+            "description": description,
+            "responsible_party": responsible_party,
+            "deadline": (today + _DAYS[days]).isoformat(),
+            "status": status
         })
+        # Documents due within three days are on the critical path
+        if days <= 3:
+            critical_path_items.append(document)
     
     # Calculate preparation status
     total_docs = len(required_documents)
-    completed_docs = len([doc for doc in required_documents if doc["status"] == "Complete"])
-    in_progress_docs = len([doc for doc in required_documents if doc["status"] in ["In Preparation", "Ordered", "Scheduled"]])
+    completed_docs = 0
+    in_progress_docs = 0
+    for doc in required_documents:
+        if doc["status"] == "Complete":
+            completed_docs += 1
+        elif doc["status"] in ("In Preparation", "Ordered", "Scheduled"):
+            in_progress_docs += 1
     
     preparation_percentage = (completed_docs + (in_progress_docs * 0.5)) / total_docs * 100
     
+    party_counts = Counter(doc["responsible_party"] for doc in required_documents)
+    lender_docs = party_counts["Lender"]
+    borrower_docs = party_counts["Borrower"]
+    title_company_docs = party_counts["Title Company"]
+    
     return {
         "preparation_id": preparation_id,
         "document_summary": {
@@ -124,11 +273,8 @@ def prepare_closing_documents(loan_data: Dict[str, Any], property_data: Dict[str
         },
         "required_documents": required_documents,
         "preparation_timeline": {
-            "estimated_completion": (datetime.now() + timedelta(days=14)).isoformat(),
-            "critical_path_items": [
-                doc["document"] for doc in required_documents 
-                if datetime.fromisoformat(doc["deadline"]) <= datetime.now() + timedelta(days=3)
-            ]
+            "estimated_completion": (today + _DAYS[14]).isoformat(),
+            "critical_path_items": critical_path_items
         },
         "loan_details": {
             "loan_amount": loan_data.get("loan_amount", 0),
@@ -136,20 +282,14 @@ def prepare_closing_documents(loan_data: Dict[str, Any], property_data: Dict[str
             "interest_rate": loan_data.get("interest_rate", 0),
             "property_address": property_data.get("address", "Not provided")
         },
-        "next_steps": [
-            "Complete Closing Disclosure preparation",
-            "Coordinate with title company for title insurance",
-            "Obtain borrower insurance binder",
-            "Schedule final walkthrough",
-            "Prepare loan documents for execution"
-        ],
+        "next_steps": list(_PREP_NEXT_STEPS),
         "responsible_parties": {
-            "lender": len([doc for doc in required_documents if doc["responsible_party"] == "Lender"]),
-            "borrower": len([doc for doc in required_documents if doc["responsible_party"] == "Borrower"]),
-            "title_company": len([doc for doc in required_documents if doc["responsible_party"] == "Title Company"]),
-            "other": len([doc for doc in required_documents if doc["responsible_party"] not in ["Lender", "Borrower", "Title Company"]])
+            "lender": lender_docs,
+            "borrower": borrower_docs,
+            "title_company": title_company_docs,
+            "other": total_docs - lender_docs - borrower_docs - title_company_docs
         },
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now.isoformat()
     }
 
 
@@ -168,7 +308,9 @@ def coordinate_title_escrow(property_address: str, loan_amount: float,
     Returns:
         Title and escrow coordination status
     """
-    coordination_id = f"TITLE_{datetime.now().strftime('%Y%m%d')}_{uuid.uuid4().hex[:8].upper()}"
+    now = datetime.now()
+    coordination_id = _make_id("TITLE", now)
+    today = now.date()  # Completion estimates are day-level
     
     if title_company is None:
         title_company = "Demo Title & Escrow Company"
@@ -178,96 +320,46 @@ def coordinate_title_escrow(property_address: str, loan_amount: float,
     # Title work components
     title_work = [
         {
-            "component": "Title Search",
-            "description": "Research property ownership history",
-            "status": "In Progress",
-            "estimated_completion": (datetime.now() + timedelta(days=5)).isoformat(),
-            "cost": 150.00
-        },
-        {
-            "component": "Title Examination",
-            "description": "Review title search results for issues",
-            "status": "Pending",
-            "estimated_completion": (datetime.now() + timedelta(days=7)).isoformat(),
-            "cost": 200.00
-        },
-        {
-            "component": "Title Insurance Commitment",
-            "description": "Issue title insurance commitment",
-            "status": "Pending",
-            "estimated_completion": (datetime.now() + timedelta(days=9)).isoformat(),
-            "cost": loan_amount * 0.0006  # 0.06% of loan amount
-        },
-        {
-            "component": "Survey Review",
-            "description": "Review property survey for boundary issues",
-            "status": "Ordered",
-            "estimated_completion": (datetime.now() + timedelta(days=10)).isoformat(),
-            "cost": 350.00
+            "component": component,
+            "description": description,
+            "status": status,
+            "estimated_completion": (today + _DAYS[days]).isoformat(),
+            "cost": loan_amount * 0.0006 if cost is None else cost
         }
+        for component, description, status, days, cost in _TITLE_WORK
     ]
     
     # Escrow services
-    escrow_services = [
-        {
-            "service": "Escrow Account Setup",
-            "description": "Establish neutral escrow account",
-            "status": "Complete",
-            "cost": 250.00
-        },
-        {
-            "service": "Document Preparation",
-            "description": "Prepare closing and recording documents",
-            "status": "In Progress",
-            "cost": 300.00
-        },
-        {
-            "service": "Closing Coordination",
-            "description": "Schedule and coordinate closing meeting",
-            "status": "Pending",
-            "cost": 150.00
-        },
-        {
-            "service": "Recording Services",
-            "description": "Record documents with county recorder",
-            "status": "Pending",
-            "cost": 85.00
-        }
-    ]
+    escrow_services = list(map(dict, _ESCROW_SERVICES))
     
     # Calculate total costs
-    title_costs = sum(item["cost"] for item in title_work)
-    escrow_costs = sum(item["cost"] for item in escrow_services)
+    title_costs = 0
+    title_complete = 0
+    for item in title_work:
+        title_costs += item["cost"]
+        if item["status"] == "Complete":
+            title_complete += 1
+    escrow_costs = _ESCROW_COSTS
     total_costs = title_costs + escrow_costs
     
     # Identify potential issues
     potential_issues = []
     
     # Simulate common title issues
-    if random.choice([True, False]):
-        potential_issues.append({
-            "issue": "Unpaid Property Taxes",
-            "description": "Outstanding property taxes must be paid at closing",
-            "severity": "Medium",
-            "resolution": "Calculate and collect tax prorations at closing"
-        })
+    if random.getrandbits(1):
+        potential_issues.append(dict(_UNPAID_TAXES_ISSUE))
     
-    if random.choice([True, False]):
-        potential_issues.append({
-            "issue": "Easement on Property",
-            "description": "Utility easement identified in title search",
-            "severity": "Low",
-            "resolution": "Verify easement doesn't affect property use"
-        })
+    if random.getrandbits(1):
+        potential_issues.append(dict(_EASEMENT_ISSUE))
     
     return {
         "coordination_id": coordination_id,
         "title_company": title_company,
         "property_address": property_address,
         "coordination_summary": {
-            "title_work_progress": len([item for item in title_work if item["status"] == "Complete"]) / len(title_work) * 100,
-            "escrow_progress": len([item for item in escrow_services if item["status"] == "Complete"]) / len(escrow_services) * 100,
-            "estimated_completion": (datetime.now() + timedelta(days=12)).isoformat(),
+            "title_work_progress": title_complete / len(title_work) * 100,
+            "escrow_progress": _ESCROW_PROGRESS,
+            "estimated_completion": (today + _DAYS[12]).isoformat(),
             "total_estimated_costs": round(total_costs, 2)
         },
         "title_work": title_work,
@@ -280,53 +372,24 @@ def coordinate_title_escrow(property_address: str, loan_amount: float,
             "borrower_paid": round(total_costs * 0.7, 2)
         },
         "potential_issues": potential_issues,
-        "next_actions": [
-            "Complete title search and examination",
-            "Resolve any title issues identified",
-            "Prepare title insurance commitment",
-            "Schedule closing date and time",
-            "Coordinate document signing"
-        ],
-        "contact_information": {
-            "title_officer": "Jane Smith, Senior Title Officer",
-            "escrow_officer": "Bob Johnson, Escrow Officer",
-            "phone": "(555) 123-4567",
-            "email": "closing@demotitle.com"
-        },
-        "timestamp": datetime.now().isoformat()
+        "next_actions": list(_TITLE_NEXT_ACTIONS),
+        "contact_information": dict(_TITLE_CONTACTS),
+        "timestamp": now.isoformat()
     }
 
 
-@tool
-def calculate_closing_costs(loan_data: Dict[str, Any], property_data: Dict[str, Any] = None,
-                          cost_selections: Dict[str, Any] = None) -> Dict[str, Any]:
+@functools.lru_cache(maxsize=256, typed=True)
+def _closing_cost_sections(loan_amount: float, property_value: float, loan_type: str, interest_rate: float,
+                           points_purchased: float, home_inspection: float, home_warranty: float,
+                           city_tax_applicable: bool, hoa_applicable: bool) -> tuple:
     """
-    Calculate detailed closing costs breakdown for the loan.
-    
-    Args:
-        loan_data: Complete loan information including amount and terms
-        property_data: Property information for cost calculations
-        cost_selections: Borrower selections for optional services
-        
-    Returns:
-        Detailed closing costs calculation
+    Itemized closing costs as ((label, items, total), ...) and the grand total.
+    Pure arithmetic on the loan terms, so it is cached; items are frozen and copied out by the caller.
     """
-    calculation_id = f"COSTS_{datetime.now().strftime('%Y%m%d')}_{uuid.uuid4().hex[:8].upper()}"
-    
-    if property_data is None:
-        property_data = {}
-    if cost_selections is None:
-        cost_selections = {}
-    
-    loan_amount = loan_data.get("loan_amount", 0)
-    property_value = property_data.get("value", loan_amount * 1.2)  # Assume 20% down if not provided
-    loan_type = loan_data.get("loan_type", "conventional")
-    interest_rate = loan_data.get("interest_rate", 6.5)
-    
     # Origination charges (A. Origination Charges)
     origination_charges = {
         "origination_fee": loan_amount * 0.01,  # 1% of loan amount
-        "discount_points": loan_amount * cost_selections.get("points_purchased", 0) * 0.01,
+        "discount_points": loan_amount * points_purchased * 0.01,
         "processing_fee": 795.00,
         "underwriting_fee": 850.00,
         "application_fee": 500.00
@@ -347,62 +410,123 @@ def calculate_closing_costs(loan_data: Dict[str, Any], property_data: Dict[str,
         "title_insurance": property_value * 0.006,
         "title_search": 200.00,
         "attorney_fees": 750.00,
-        "home_inspection": cost_selections.get("home_inspection", 0) or 450.00
+        "home_inspection": home_inspection
     }
     
     # Government recording and transfer charges (E. Taxes and Government Fees)
     government_fees = {
         "recording_fees": 125.00,
         "transfer_tax": property_value * 0.001,  # 0.1% of property value
-        "city_tax": property_value * 0.0005 if property_data.get("city_tax_applicable", True) else 0
+        "city_tax": property_value * 0.0005 if city_tax_applicable else 0
     }
     
+    # Monthly escrow components shared by prepaids and the initial escrow payment
+    high_ltv = loan_amount/property_value > 0.8
+    annual_mortgage_insurance = loan_amount * 0.005  # Annual MIP
+    monthly_taxes = property_value * 0.012 / 12
+    monthly_insurance = 1200.00 / 12
+    
     # Prepaids (F. Prepaids)
-    monthly_payment = loan_data.get("monthly_payment", loan_amount * (interest_rate/100/12) * 1.2)  # Estimate
     prepaids = {
         "homeowners_insurance": 1200.00,  # Annual premium
-        "mortgage_insurance": loan_amount * 0.005 if loan_amount/property_value > 0.8 else 0,  # Annual MIP
+        "mortgage_insurance": annual_mortgage_insurance if high_ltv else 0,
         "prepaid_interest": (loan_amount * interest_rate/100/365) * 15,  # 15 days interest
-        "property_tax_reserves": (property_value * 0.012) / 12 * 3,  # 3 months taxes
-        "insurance_reserves": 1200.00 / 12 * 2  # 2 months insurance
+        "property_tax_reserves": monthly_taxes * 3,  # 3 months taxes
+        "insurance_reserves": monthly_insurance * 2  # 2 months insurance
     }
     
     # Initial escrow payment (G. Initial Escrow Payment at Closing)
     escrow_payment = {
-        "property_taxes": property_value * 0.012 / 12 * 6,  # 6 months
-        "homeowners_insurance": 1200.00 / 12 * 6,  # 6 months
-        "mortgage_insurance": (loan_amount * 0.005 / 12 * 6) if loan_amount/property_value > 0.8 else 0
+        "property_taxes": monthly_taxes * 6,  # 6 months
+        "homeowners_insurance": monthly_insurance * 6,  # 6 months
+        "mortgage_insurance": (annual_mortgage_insurance / 12 * 6) if high_ltv else 0
     }
     
     # Other costs (H. Other)
     other_costs = {
-        "home_warranty": cost_selections.get("home_warranty", 0) or 450.00,
+        "home_warranty": home_warranty,
         "pest_inspection": 125.00,
-        "hoa_transfer_fee": 150.00 if property_data.get("hoa_applicable", False) else 0
+        "hoa_transfer_fee": 150.00 if hoa_applicable else 0
     }
     
     # Loan-specific fees
-    if loan_type.lower() == "va":
+    if loan_type == "va":
         origination_charges["va_funding_fee"] = loan_amount * 0.023  # 2.3% for first-time use
-    elif loan_type.lower() == "fha":
+    elif loan_type == "fha":
         origination_charges["fha_upfront_mip"] = loan_amount * 0.0175  # 1.75% upfront MIP
     
     # Calculate totals
-    section_totals = {
-        "origination_charges": sum(origination_charges.values()),
-        "cannot_shop_services": sum(cannot_shop_services.values()),
-        "can_shop_services": sum(can_shop_services.values()),
-        "government_fees": sum(government_fees.values()),
-        "prepaids": sum(prepaids.values()),
-        "escrow_payment": sum(escrow_payment.values()),
-        "other_costs": sum(other_costs.values())
-    }
+    sections = []
+    total_closing_costs = 0
+    for label, items in (
+        ("A_origination_charges", origination_charges),
+        ("B_cannot_shop_services", cannot_shop_services),
+        ("C_can_shop_services", can_shop_services),
+        ("E_government_fees", government_fees),
+        ("F_prepaids", prepaids),
+        ("G_escrow_payment", escrow_payment),
+        ("H_other_costs", other_costs)
+    ):
+        section_total = sum(items.values())
+        sections.append((label, MappingProxyType(items), section_total))
+        total_closing_costs += section_total
+    
+    return tuple(sections), total_closing_costs
+
+
+@tool
+def calculate_closing_costs(loan_data: Dict[str, Any], property_data: Dict[str, Any] = None,
+                          cost_selections: Dict[str, Any] = None) -> Dict[str, Any]:
+    """
+    Calculate detailed closing costs breakdown for the loan.
+    
+    Args:
+        loan_data: Complete loan information including amount and terms
+        property_data: Property information for cost calculations
+        cost_selections: Borrower selections for optional services
+        
+    Returns:
+        Detailed closing costs calculation
+    """
+    now = datetime.now()
+    calculation_id = _make_id("COSTS", now)
+    
+    if property_data is None:
+        property_data = {}
+    if cost_selections is None:
+        cost_selections = {}
     
-    total_closing_costs = sum(section_totals.values())
+    loan_amount = loan_data.get("loan_amount", 0)
+    property_value = property_data.get("value", loan_amount * 1.2)  # Assume 20% down if not provided
+    loan_type = loan_data.get("loan_type", "conventional")
+    interest_rate = loan_data.get("interest_rate", 6.5)
+    
+    sections, total_closing_costs = _closing_cost_sections(
+        loan_amount, property_value, loan_type.lower(), interest_rate,
+        cost_selections.get("points_purchased", 0),
+        cost_selections.get("home_inspection", 0) or 450.00,
+        cost_selections.get("home_warranty", 0) or 450.00,
+        bool(property_data.get("city_tax_applicable", True)),
+        bool(property_data.get("hoa_applicable", False))
+    )
+    closing_cost_breakdown = {}
+    section_totals = {}
+    for label, items, section_total in sections:
+        closing_cost_breakdown[label] = {"items": dict(items), "total": round(section_total, 2)}
+        section_totals[label] = section_total
+    origination_charges = closing_cost_breakdown["A_origination_charges"]["items"]
+    can_shop_services = closing_cost_breakdown["C_can_shop_services"]["items"]
     
     # Cash to close calculation
     down_payment = property_value - loan_amount
     cash_to_close = total_closing_costs + down_payment
+    national_average = loan_amount * 0.025  # 2.5% average
+    
+    # Figures quoted in the shopping tips and payment timeline
+    title_insurance = can_shop_services["title_insurance"]
+    attorney_fees = can_shop_services["attorney_fees"]
+    home_inspection = can_shop_services["home_inspection"]
+    application_fee = origination_charges["application_fee"]
     
     return {
         "calculation_id": calculation_id,
@@ -412,36 +536,7 @@ def calculate_closing_costs(loan_data: Dict[str, Any], property_data: Dict[str,
             "loan_type": loan_type,
             "interest_rate": interest_rate
         },
-        "closing_cost_breakdown": {
-            "A_origination_charges": {
-                "items": origination_charges,
-                "total": round(section_totals["origination_charges"], 2)
-            },
-            "B_cannot_shop_services": {
-                "items": cannot_shop_services,
-                "total": round(section_totals["cannot_shop_services"], 2)
-            },
-            "C_can_shop_services": {
-                "items": can_shop_services,
-                "total": round(section_totals["can_shop_services"], 2)
-            },
-            "E_government_fees": {
-                "items": government_fees,
-                "total": round(section_totals["government_fees"], 2)
-            },
-            "F_prepaids": {
-                "items": prepaids,
-                "total": round(section_totals["prepaids"], 2)
-            },
-            "G_escrow_payment": {
-                "items": escrow_payment,
-                "total": round(section_totals["escrow_payment"], 2)
-            },
-            "H_other_costs": {
-                "items": other_costs,
-                "total": round(section_totals["other_costs"], 2)
-            }
-        },
+        "closing_cost_breakdown": closing_cost_breakdown,
         "cost_summary": {
             "total_closing_costs": round(total_closing_costs, 2),
             "down_payment": round(down_payment, 2),
@@ -449,21 +544,21 @@ def calculate_closing_costs(loan_data: Dict[str, Any], property_data: Dict[str,
             "closing_costs_percentage": round((total_closing_costs / loan_amount) * 100, 2)
         },
         "cost_comparison": {
-            "national_average": round(loan_amount * 0.025, 2),  # 2.5% average
-            "compared_to_average": "Below Average" if total_closing_costs < loan_amount * 0.025 else "Above Average",
-            "variance": round(total_closing_costs - (loan_amount * 0.025), 2)
+            "national_average": round(national_average, 2),
+            "compared_to_average": "Below Average" if total_closing_costs < national_average else "Above Average",
+            "variance": round(total_closing_costs - national_average, 2)
         },
         "shopping_opportunities": [
-            f"Title insurance: Shop for competitive rates (current: ${can_shop_services['title_insurance']:.2f})",
-            f"Attorney fees: Compare local attorney rates (current: ${can_shop_services['attorney_fees']:.2f})",
-            f"Home inspection: Optional service (current: ${can_shop_services.get('home_inspection', 450):.2f})"
+            f"Title insurance: Shop for competitive rates (current: ${title_insurance:.2f})",
+            f"Attorney fees: Compare local attorney rates (current: ${attorney_fees:.2f})",
+            f"Home inspection: Optional service (current: ${home_inspection:.2f})"
         ],
         "payment_timeline": {
-            "due_at_application": round(origination_charges.get("application_fee", 0), 2),
-            "due_before_closing": round(section_totals["cannot_shop_services"] + section_totals["can_shop_services"], 2),
-            "due_at_closing": round(total_closing_costs - origination_charges.get("application_fee", 0), 2)
+            "due_at_application": round(application_fee, 2),
+            "due_before_closing": round(section_totals["B_cannot_shop_services"] + section_totals["C_can_shop_services"], 2),
+            "due_at_closing": round(total_closing_costs - application_fee, 2)
         },
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now.isoformat()
     }
 
 
@@ -481,7 +576,8 @@ def schedule_closing_meeting(participants: List[str], preferred_date: str = None
     Returns:
         Closing meeting scheduling details
     """
-    scheduling_id = f"SCHED_{datetime.now().strftime('%Y%m%d')}_{uuid.uuid4().hex[:8].upper()}"
+    now = datetime.now()
+    scheduling_id = _make_id("SCHED", now)
     
     # Default participants if not provided
     if not participants:
@@ -489,80 +585,62 @@ def schedule_closing_meeting(participants: List[str], preferred_date: str = None
     
     # Default preferred date (7-14 days from now)
     if preferred_date is None:
-        preferred_date = (datetime.now() + timedelta(days=10)).strftime('%Y-%m-%d')
+        preferred_date = (now.date() + _DAYS[10]).isoformat()
     
     if location_preference is None:
         location_preference = "title_company"
     
-    # Generate available time slots
+    # Generate available time slots, tracking the one closest to the preferred date
     available_slots = []
+    recommended_slot = None
+    best_distance = None
     base_date = datetime.strptime(preferred_date, '%Y-%m-%d')
     
     for day_offset in [-2, -1, 0, 1, 2]:  # 5 day window around preferred date
-        slot_date = base_date + timedelta(days=day_offset)
+        slot_date = base_date + _DAYS[day_offset]
         
         # Skip weekends
-        if slot_date.weekday() >= 5:
+        weekday = slot_date.weekday()
+        if weekday >= 5:
             continue
+        
+        # Every slot on this day shares its date fields
+        date_str = slot_date.date().isoformat()
+        day_of_week = _WEEKDAY_NAMES[weekday]
+            
+        # Morning and afternoon slots, skipping booked ones
+        for hour, iso_time, display_time in _SLOT_HOURS:
+            if random.random() >= 0.75:  # Most slots available
+                continue
+            slot = {
+                "datetime": date_str + iso_time,
+                "date": date_str,
+                "time": display_time,
+                "day_of_week": day_of_week,
+                "available": True
+            }
+            available_slots.append(slot)
             
-        # Morning and afternoon slots
-        for hour in [9, 10, 11, 14, 15, 16]:
-            slot_time = slot_date.replace(hour=hour, minute=0)
-            available_slots.append({
-                "datetime": slot_time.isoformat(),
-                "date": slot_time.strftime('%Y-%m-%d'),
-                "time": slot_time.strftime('%I:%M %p'),
-                "day_of_week": slot_time.strftime('%A'),
-                "available": random.choice([True, True, True, False])  # Most slots available
-            })
-    
-    # Filter to available slots
-    available_slots = [slot for slot in available_slots if slot["available"]]
-    
-    # Recommend best slot (closest to preferred date and time)
-    if available_slots:
-        recommended_slot = min(available_slots, 
-                             key=lambda x: abs((datetime.fromisoformat(x["datetime"]) - base_date).total_seconds()))
-    else:
-        recommended_slot = None
+            # Hours from midnight of the preferred date; earlier slots win ties
+            distance = abs(day_offset * 24 + hour)
+            if best_distance is None or distance < best_distance:
+                recommended_slot = slot
+                best_distance = distance
     
     # Participant coordination
     participant_details = []
     for participant in participants:
         participant_details.append({
             "role": participant,
-            "required": participant in ["borrower", "seller", "title_officer"],
+            "required": participant in _REQUIRED_ROLES,
             "contact_method": "email_and_phone",
             "confirmation_status": "pending",
             "special_requirements": "None"
         })
     
     # Location details
-    location_details = {
-        "title_company": {
-            "name": "Demo Title & Escrow Company",
-            "address": "123 Title Plaza, Suite 200, Anytown, ST 12345",
-            "phone": "(555) 123-4567",
-            "parking": "Free parking available",
-            "amenities": ["Conference room", "Notary services", "Document copies"]
-        },
-        "lender": {
-            "name": "Demo Mortgage Lender",
-            "address": "456 Lending Lane, Financial District, Anytown, ST 12345",
-            "phone": "(555) 234-5678",
-            "parking": "Validated parking",
-            "amenities": ["Conference room", "Refreshments", "Wi-Fi"]
-        },
-        "attorney": {
-            "name": "Demo Legal Services",
-            "address": "789 Law Street, Legal District, Anytown, ST 12345",
-            "phone": "(555) 345-6789",
-            "parking": "Street parking",
-            "amenities": ["Private office", "Notary services"]
-        }
-    }
-    
-    selected_location = location_details.get(location_preference, location_details["title_company"])
+    location = _LOCATION_DETAILS.get(location_preference, _LOCATION_DETAILS["title_company"])
+    selected_location = {**location, "amenities": list(location["amenities"])}
     
     return {
         "scheduling_id": scheduling_id,
@@ -577,33 +655,17 @@ def schedule_closing_meeting(participants: List[str], preferred_date: str = None
         "available_time_slots": available_slots[:8],  # Show first 8 available slots
         "participants": participant_details,
         "location_details": selected_location,
-        "preparation_requirements": [
-            "All participants must bring valid photo ID",
-            "Borrower must bring certified funds for closing costs",
-            "Final walkthrough must be completed before closing",
-            "All loan conditions must be satisfied",
-            "Insurance binder must be provided"
-        ],
+        "preparation_requirements": list(_MEETING_REQUIREMENTS),
         "estimated_duration": "45-90 minutes",
-        "coordination_notes": [
-            "Confirm all participants 24 hours before closing",
-            "Review closing disclosure with borrower before meeting",
-            "Ensure all documents are prepared and reviewed",
-            "Coordinate fund transfer timing",
-            "Plan for document recording after signing"
-        ],
-        "backup_options": [
-            "Remote/mobile closing available",
-            "Evening appointments by special arrangement",
-            "Weekend closings for urgent situations"
-        ],
+        "coordination_notes": list(_MEETING_NOTES),
+        "backup_options": list(_MEETING_BACKUP_OPTIONS),
         "contact_information": {
             "closing_coordinator": "Sarah Wilson",
             "phone": selected_location["phone"],
             "email": "closings@demotitle.com",
             "emergency_contact": "(555) 999-0000"
         },
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now.isoformat()
     }
 
 
@@ -621,112 +683,64 @@ def post_closing_coordination(loan_id: str, closing_date: str,
     Returns:
         Post-closing coordination status and next steps
     """
-    coordination_id = f"POST_{datetime.now().strftime('%Y%m%d')}_{uuid.uuid4().hex[:8].upper()}"
+    now = datetime.now()
+    coordination_id = _make_id("POST", now)
     
     if recording_info is None:
         recording_info = {}
     
-    closing_datetime = datetime.strptime(closing_date, '%Y-%m-%d')
+    closing_day = datetime.strptime(closing_date, '%Y-%m-%d').date()
+    recording_deadline = (closing_day + _DAYS[1]).isoformat()
+    delivery_deadline = (closing_day + _DAYS[60]).isoformat()
     
     # Post-closing checklist
+    recording_status = recording_info.get("recording_status", "In Progress")
     post_closing_tasks = [
         {
-            "task": "Document Recording",
-            "description": "Record deed and mortgage with county recorder",
-            "responsible_party": "Title Company",
-            "due_date": (closing_datetime + timedelta(days=1)).isoformat(),
-            "status": recording_info.get("recording_status", "In Progress"),
-            "priority": "Critical"
-        },
-        {
-            "task": "Loan Funding Confirmation",
-            "description": "Confirm loan funds have been disbursed",
-            "responsible_party": "Lender",
-            "due_date": closing_datetime.isoformat(),
-            "status": "Complete",
-            "priority": "Critical"
-        },
-        {
-            "task": "Title Insurance Policy Issuance",
-            "description": "Issue final title insurance policy",
-            "responsible_party": "Title Company",
-            "due_date": (closing_datetime + timedelta(days=30)).isoformat(),
-            "status": "Pending",
-            "priority": "High"
-        },
-        {
-            "task": "Loan Delivery to Investor",
-            "description": "Deliver loan package to secondary market investor",
-            "responsible_party": "Lender",
-            "due_date": (closing_datetime + timedelta(days=60)).isoformat(),
-            "status": "Not Started",
-            "priority": "High"
-        },
-        {
-            "task": "Escrow Account Setup",
-            "description": "Establish escrow account for taxes and insurance",
-            "responsible_party": "Loan Servicer",
-            "due_date": (closing_datetime + timedelta(days=45)).isoformat(),
-            "status": "In Progress",
-            "priority": "Medium"
-        },
-        {
-            "task": "Welcome Package to Borrower",
-            "description": "Send loan servicing information to borrower",
-            "responsible_party": "Loan Servicer",
-            "due_date": (closing_datetime + timedelta(days=10)).isoformat(),
-            "status": "Scheduled",
-            "priority": "Medium"
-        },
-        {
-            "task": "Quality Control Review",
-            "description": "Post-closing quality control audit",
-            "responsible_party": "Lender",
-            "due_date": (closing_datetime + timedelta(days=30)).isoformat(),
-            "status": "Scheduled",
-            "priority": "Medium"
+            "task": task,
+            "description": description,
+            "responsible_party": responsible_party,
+            "due_date": (closing_day + _DAYS[days]).isoformat(),
+            "status": recording_status if status is None else status,
+            "priority": priority
         }
+        for task, description, responsible_party, days, status, priority in _POST_CLOSING_TASKS
     ]
     
     # Calculate completion status
-    completed_tasks = len([task for task in post_closing_tasks if task["status"] == "Complete"])
-    in_progress_tasks = len([task for task in post_closing_tasks if task["status"] == "In Progress"])
-    critical_pending = len([task for task in post_closing_tasks if task["priority"] == "Critical" and task["status"] != "Complete"])
+    completed_tasks = 0
+    in_progress_tasks = 0
+    critical_pending = 0
+    for task in post_closing_tasks:
+        if task["status"] == "Complete":
+            completed_tasks += 1
+            continue
+        if task["status"] == "In Progress":
+            in_progress_tasks += 1
+        if task["priority"] == "Critical":
+            critical_pending += 1
     
     completion_percentage = (completed_tasks + (in_progress_tasks * 0.5)) / len(post_closing_tasks) * 100
     
-    # Loan delivery preparation
-    loan_delivery_items = [
-        "Original promissory note",
-        "Recorded deed of trust/mortgage",
-        "Closing disclosure",
-        "Title insurance policy",
-        "Property appraisal",
-        "Income and employment verification",
-        "Credit report",
-        "Property insurance evidence",
-        "Compliance certifications"
-    ]
-    
     # Quality control checkpoints
     qc_checkpoints = [
         {
             "checkpoint": "Document Completeness",
             "description": "Verify all required documents are in loan file",
             "status": "Pending",
-            "due_date": (closing_datetime + timedelta(days=15)).isoformat()
+            "due_date": (closing_day + _DAYS[15]).isoformat()
         },
         {
             "checkpoint": "Compliance Review",
             "description": "Verify regulatory compliance requirements met",
             "status": "Pending",
-            "due_date": (closing_datetime + timedelta(days=20)).isoformat()
+            "due_date": (closing_day + _DAYS[20]).isoformat()
         },
         {
             "checkpoint": "Funding Verification",
             "description": "Confirm proper loan funding and disbursement",
             "status": "Complete",
-            "due_date": closing_datetime.isoformat()
+            "due_date": closing_day.isoformat()
         }
     ]
     
@@ -739,44 +753,38 @@ def post_closing_coordination(loan_id: str, closing_date: str,
             "total_tasks": len(post_closing_tasks),
             "completed_tasks": completed_tasks,
             "critical_pending": critical_pending,
-            "estimated_completion": (closing_datetime + timedelta(days=60)).isoformat()
+            "estimated_completion": delivery_deadline
         },
         "post_closing_tasks": post_closing_tasks,
         "loan_delivery": {
-            "delivery_deadline": (closing_datetime + timedelta(days=60)).isoformat(),
-            "required_documents": loan_delivery_items,
+            "delivery_deadline": delivery_deadline,
+            "required_documents": list(_LOAN_DELIVERY_ITEMS),
             "investor_requirements": "Standard agency delivery requirements",
             "delivery_method": "Electronic via investor portal"
         },
         "quality_control": {
             "qc_checkpoints": qc_checkpoints,
-            "qc_completion_deadline": (closing_datetime + timedelta(days=30)).isoformat(),
+            "qc_completion_deadline": (closing_day + _DAYS[30]).isoformat(),
             "audit_requirements": "Standard post-closing audit procedures"
         },
         "borrower_communications": {
-            "welcome_package_sent": "Scheduled for " + (closing_datetime + timedelta(days=10)).strftime('%Y-%m-%d'),
-            "first_payment_due": (closing_datetime + timedelta(days=30)).strftime('%Y-%m-%d'),
+            "welcome_package_sent": "Scheduled for " + (closing_day + _DAYS[10]).isoformat(),
+            "first_payment_due": (closing_day + _DAYS[30]).isoformat(),
             "servicing_contact": "Demo Loan Servicing - (555) 123-9999",
             "online_account_setup": "Available at www.demoloanservicing.com"
         },
         "critical_deadlines": [
             {
                 "deadline": "Document recording",
-                "date": (closing_datetime + timedelta(days=1)).isoformat(),
-                "status": recording_info.get("recording_status", "In Progress")
+                "date": recording_deadline,
+                "status": recording_status
             },
             {
                 "deadline": "Loan delivery to investor",
-                "date": (closing_datetime + timedelta(days=60)).isoformat(),
+                "date": delivery_deadline,
                 "status": "Pending"
             }
         ],
-        "next_actions": [
-            "Confirm document recording completion",
-            "Begin loan delivery package preparation",
-            "Schedule quality control review",
-            "Monitor critical task completion",
-            "Coordinate with loan servicer for borrower communications"
-        ],
-        "timestamp": datetime.now().isoformat()
+        "next_actions": list(_POST_CLOSING_NEXT_ACTIONS),
+        "timestamp": now.isoformat()
     }
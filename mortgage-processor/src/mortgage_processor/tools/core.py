@@ -5,146 +5,333 @@ These tools only extract data and provide information.
 The AI agent makes ALL validation decisions based on configuration rules.
 """
 
+import bisect
+import functools
 import logging
-import uuid
+import os
+import random
 import re
+import secrets
+import time
+import zlib
 from datetime import datetime, date, timedelta
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 from llama_stack_client.lib.agents.client_tool import client_tool
 from langchain_core.tools import tool
 from ..models import DocumentType
-from ..database import get_db_session, MortgageApplicationDB
 from ..application_lifecycle import get_application_manager, ApplicationIntent, ApplicationPhase
 
+# orjson (installed alongside langsmith) parses the UI state payloads faster; stdlib as fallback
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
+# Non-cryptographic RNG for demo document identifiers
+_rand = random.Random()
 
-@client_tool
-def classify_document_type(document_content: str, file_name: str) -> Dict[str, Any]:
+# Document type values bound once so hot paths skip the Enum attribute lookups
+_DL = DocumentType.DRIVER_LICENSE.value
+_PP = DocumentType.PASSPORT.value
+_PS = DocumentType.PAY_STUB.value
+_TS = DocumentType.TAX_STATEMENT.value
+_BS = DocumentType.BANK_STATEMENT.value
+
+# Keyword classification rules in priority order: (document type, confidence, keywords)
+_DOC_TYPE_RULES = (
+    (_DL, 0.92, ("driver", "license", "id")),
+    (_BS, 0.88, ("bank", "statement", "account", "balance")),
+    (_TS, 0.85, ("tax", "1040", "w-2", "irs")),
+    (_PS, 0.90, ("pay", "stub", "payroll", "earnings")),
+    (_PP, 0.95, ("passport", "united states")),
+)
+
+# Leading characters checked for the top-priority rule before lowercasing a whole document
+_CLASSIFY_HEAD = 4096
+
+# Tool timestamps are only labels, so the ISO string is rebuilt at most once per second
+_ts_cache = [-1, ""]
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO string, cached at one-second resolution"""
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache[:] = [now, datetime.fromtimestamp(now).isoformat()]
+    return _ts_cache[1]
+
+
+def _today_iso() -> str:
+    """Current local date as an ISO string (date part of the cached timestamp)"""
+    return _now_iso()[:10]
+
+
+@functools.lru_cache(maxsize=256)
+def _classify(document_content: str, file_name: str) -> tuple[str, float]:
     """
-    Extract basic metadata and classify document type.
-    Agent will make validation decisions based on the classification.
-    
-    :param document_content: Text content of the document
-    :param file_name: Original filename
-    :returns: Document metadata without validation decisions
+    Keyword classification shared by the single and batch document tools.
+    Cached because agents often reclassify the same document within a session.
     """
-    content_lower = document_content.lower()
-    file_lower = file_name.lower()
-    
-    # Simple keyword-based classification for demo
-    if any(word in content_lower for word in ["driver", "license", "id"]) or "license" in file_lower:
-        doc_type = DocumentType.DRIVER_LICENSE
+    # Simple keyword-based classification for demo - first matching rule wins
+    doc_type = _DL  # Default fallback
+    confidence = 0.45
+    if "license" in file_name.lower():
+        doc_type = _DL
         confidence = 0.92
-    elif any(word in content_lower for word in ["bank", "statement", "account", "balance"]):
-        doc_type = DocumentType.BANK_STATEMENT
-        confidence = 0.88
-    elif any(word in content_lower for word in ["tax", "1040", "w-2", "irs"]):
-        doc_type = DocumentType.TAX_STATEMENT
-        confidence = 0.85
-    elif any(word in content_lower for word in ["pay", "stub", "payroll", "earnings"]):
-        doc_type = DocumentType.PAY_STUB
-        confidence = 0.90
-    elif any(word in content_lower for word in ["passport", "united states"]):
-        doc_type = DocumentType.PASSPORT
-        confidence = 0.95
     else:
-        doc_type = DocumentType.DRIVER_LICENSE  # Default fallback
-        confidence = 0.45
-    
+        # The top-priority rule wins wherever it matches, so when its keywords already appear in the
+        # head of the document the rest never needs lowercasing
+        content_lower = document_content[:_CLASSIFY_HEAD].lower()
+        if len(document_content) > _CLASSIFY_HEAD and not any(word in content_lower for word in _DOC_TYPE_RULES[0][2]):
+            content_lower = document_content.lower()
+        for rule_type, rule_confidence, keywords in _DOC_TYPE_RULES:
+            if any(word in content_lower for word in keywords):
+                doc_type = rule_type
+                confidence = rule_confidence
+                break
+    return doc_type, confidence
+
+
+def _classification_result(document_content: str, file_name: str, timestamp: str) -> Dict[str, Any]:
+    """classify_document_type response for one document"""
+    doc_type, confidence = _classify(document_content, file_name)
     return {
-        "document_type": doc_type.value,
+        "document_type": doc_type,
         "confidence_score": confidence,
         "classification_method": "keyword_analysis",
         "file_name": file_name,
         "content_length": len(document_content),
-        "timestamp": datetime.now().isoformat()
+        "timestamp": timestamp
     }
 
 
 @client_tool
-def validate_document_expiration(document_content: str, document_type: str) -> Dict[str, Any]:
+def classify_document_type(document_content: str, file_name: str) -> Dict[str, Any]:
     """
-    Extract date information from documents.
-    Agent will determine expiration status using validation rules from config.
+    Extract basic metadata and classify document type.
+    Agent will make validation decisions based on the classification.
     
     :param document_content: Text content of the document
-    :param document_type: Type of document being processed
-    :returns: Raw date information for agent to validate
+    :param file_name: Original filename
+    :returns: Document metadata without validation decisions
+    """
+    return _classification_result(document_content, file_name, _now_iso())
+
+
+@client_tool
+def classify_document_types(contents: List[str], file_names: List[str]) -> List[Dict[str, Any]]:
+    """
+    Classify a batch of documents in one tool call.
+    Same per-document metadata as classify_document_type, in input order.
+    
+    :param contents: Text content of each document
+    :param file_names: Original filename of each document, aligned with contents
+    :returns: Document metadata for each document without validation decisions
     """
-    today = date.today()
+    if len(contents) != len(file_names):
+        raise ValueError(f"contents and file_names must be the same length ({len(contents)} != {len(file_names)})")
+    
+    timestamp = _now_iso()
+    return [
+        _classification_result(document_content, file_name, timestamp)
+        for document_content, file_name in zip(contents, file_names)
+    ]
+
+
+# Demo driver license (issue, expiration) offsets in days from today:
+# 5 years ago / 45 days out, 6 years ago / expired 30 days ago, 1 year ago / 6 months out
+_DL_OFFSETS = ((-1825, 45), (-2190, -30), (-365, 180))
+
+
+@functools.lru_cache(maxsize=1)
+def _scenarios_for(ordinal: int) -> tuple:
+    """(issue_date, expiration_date) ISO pairs for each demo scenario, built once per day"""
+    return tuple(
+        (date.fromordinal(ordinal + issue).isoformat(), date.fromordinal(ordinal + expiration).isoformat())
+        for issue, expiration in _DL_OFFSETS
+    )
+
+
+# Real date extraction is opt-in until it replaces the demo scenarios
+_EXTRACT_DOCUMENT_DATES = os.getenv("EXTRACT_DOCUMENT_DATES", "false").lower() == "true"
+
+_MONTHS = "jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec"
+_MONTH_NUMBERS = {name: number for number, name in enumerate(_MONTHS.split("|"), start=1)}
+_MONTH_NAME = rf"((?:{_MONTHS})[a-z]*)\.?"
+
+# Compiled once: (pattern, group index of year, month, day)
+_DATE_RES = (
+    (re.compile(r"\b(\d{4})-(\d{1,2})-(\d{1,2})\b"), (1, 2, 3)),  # YYYY-MM-DD
+    (re.compile(r"\b(\d{1,2})[/.-](\d{1,2})[/.-](\d{4}|\d{2})\b"), (3, 1, 2)),  # MM/DD/YYYY, MM-DD-YY, MM.DD.YYYY
+    (re.compile(rf"\b{_MONTH_NAME}\s+(\d{{1,2}}),?\s+(\d{{4}})\b", re.IGNORECASE), (3, 1, 2)),  # Month DD, YYYY
+    (re.compile(rf"\b(\d{{1,2}})\s+{_MONTH_NAME},?\s+(\d{{4}})\b", re.IGNORECASE), (3, 2, 1)),  # DD Month YYYY
+)
+
+
+def _extract_dates(text: str) -> List[date]:
+    """Sorted unique calendar dates found in text; invalid matches are skipped"""
+    found = set()
+    for pattern, (year_group, month_group, day_group) in _DATE_RES:
+        for match in pattern.finditer(text):
+            year = int(match.group(year_group))
+            if year < 100:
+                year += 2000 if year < 50 else 1900
+            month = match.group(month_group)
+            month = int(month) if month.isdigit() else _MONTH_NUMBERS[month[:3].lower()]
+            try:
+                found.add(date(year, month, int(match.group(day_group))))
+            except ValueError:
+                continue
+    return sorted(found)
+
+
+# Fixed part of the response for document types without expiration dates
+# (varying keys are listed as placeholders to keep the response field order)
+_NO_EXPIRATION_TEMPLATE = MappingProxyType({
+    "document_type": None,
+    "issue_date": None,
+    "expiration_date": None,
+    "current_date": None,
+    "extraction_method": "no_expiration_expected",
+    "confidence": 1.0,
+    "timestamp": None
+})
+
+
+def _expiration_result(document_content: str, document_type: str) -> Dict[str, Any]:
+    """Date information for one document (see validate_document_expiration)"""
+    if document_type == _DL and _EXTRACT_DOCUMENT_DATES:
+        # The two most recent dates are issue and expiration (older ones are usually date of birth)
+        dates_found = _extract_dates(document_content)
+        if len(dates_found) >= 2:
+            return {
+                "document_type": document_type,
+                "issue_date": dates_found[-2].isoformat(),
+                "expiration_date": dates_found[-1].isoformat(),
+                "current_date": _today_iso(),
+                "extraction_method": "regex_date_parsing",
+                "confidence": 0.94,
+                "timestamp": _now_iso()
+            }
     
     # Demo logic - simulate extracting dates from different document types
-    if document_type == DocumentType.DRIVER_LICENSE.value:
+    if document_type == _DL:
         # Simulate various date scenarios for demo
-        demo_scenarios = [
-            {
-                "issue_date": (today - timedelta(days=1825)).isoformat(),  # 5 years ago
-                "expiration_date": (today + timedelta(days=45)).isoformat(),  # 45 days from now
-            },
-            {
-                "issue_date": (today - timedelta(days=2190)).isoformat(),  # 6 years ago
-                "expiration_date": (today - timedelta(days=30)).isoformat(),  # 30 days ago (expired)
-            },
-            {
-                "issue_date": (today - timedelta(days=365)).isoformat(),  # 1 year ago
-                "expiration_date": (today + timedelta(days=180)).isoformat(),  # 6 months from now
-            },
-        ]
-        scenario = demo_scenarios[hash(document_content) % len(demo_scenarios)]
+        # Select on the head/tail of the content so large documents are not hashed in full;
+        # crc32 keeps the choice stable across processes (str hash is salted per run)
+        scenarios = _scenarios_for(date.today().toordinal())
+        sample = f"{len(document_content)}:{document_content[:64]}{document_content[-64:]}"
+        selector = zlib.crc32(sample.encode("utf-8", "surrogatepass"))
+        issue_date, expiration_date = scenarios[selector % len(scenarios)]
         
         return {
             "document_type": document_type,
-            "issue_date": scenario["issue_date"],
-            "expiration_date": scenario["expiration_date"],
-            "current_date": today.isoformat(),
+            "issue_date": issue_date,
+            "expiration_date": expiration_date,
+            "current_date": _today_iso(),
             "extraction_method": "demo_date_parsing",
             "confidence": 0.94,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
     
     # For other document types that don't typically have expiration dates
     return {
+        **_NO_EXPIRATION_TEMPLATE,
         "document_type": document_type,
-        "issue_date": None,
-        "expiration_date": None,
-        "current_date": today.isoformat(),
-        "extraction_method": "no_expiration_expected",
-        "confidence": 1.0,
-        "timestamp": datetime.now().isoformat()
+        "current_date": _today_iso(),
+        "timestamp": _now_iso()
     }
 
 
 @client_tool
-def extract_personal_information(document_content: str, document_type: str) -> Dict[str, Any]:
+def validate_document_expiration(document_content: str, document_type: str) -> Dict[str, Any]:
     """
-    Extract personal information from document content.
-    Returns raw extracted data without validation.
+    Extract date information from documents.
+    Agent will determine expiration status using validation rules from config.
     
     :param document_content: Text content of the document
     :param document_type: Type of document being processed
-    :returns: Raw extracted personal information
+    :returns: Raw date information for agent to validate
     """
+    return _expiration_result(document_content, document_type)
+
+
+# Demo extraction payloads are constant, so they are frozen once and copied out per call
+_EMPTY_MAPPING = MappingProxyType({})
+
+
+def _thaw(mapping: MappingProxyType) -> Dict[str, Any]:
+    """Shallow JSON-serializable copy of a frozen demo payload"""
+    return {key: dict(value) if isinstance(value, MappingProxyType) else value for key, value in mapping.items()}
+
+
+_DEMO_PERSONAL_DATA = {
+    _DL: MappingProxyType({
+        "full_name": "John Michael Smith",
+        "date_of_birth": "1985-03-15",
+        "address": "123 Main Street, Anytown, CA 90210",
+        "license_number": "D1234567",
+        "state_issued": "CA",
+        "license_class": "C"
+    }),
+    _PP: MappingProxyType({
+        "full_name": "John Michael Smith",
+        "date_of_birth": "1985-03-15",
+        "passport_number": "123456789",
+        "nationality": "United States",
+        "place_of_birth": "California, USA"
+    })
+}
+
+_DEMO_FINANCIAL_DATA = {
+    _PS: MappingProxyType({
+        "gross_pay": 5500.00,
+        "net_pay": 4200.00,
+        "pay_period": "bi-weekly",
+        "pay_date": "2024-07-15",
+        "employer_name": "Tech Solutions Inc",
+        "employee_id": "EMP12345",
+        "ytd_gross": 71500.00,
+        "ytd_taxes": 14300.00,
+        "deductions": MappingProxyType({
+            "federal_tax": 825.00,
+            "state_tax": 275.00,
+            "social_security": 341.00,
+            "medicare": 79.75
+        })
+    }),
+    _TS: MappingProxyType({
+        "tax_year": 2023,
+        "filing_status": "married_filing_jointly",
+        "annual_gross_income": 143000.00,
+        "adjusted_gross_income": 138500.00,
+        "total_tax": 28600.00,
+        "refund_amount": 2100.00,
+        "w2_employers": ("Tech Solutions Inc",),
+        "spouse_income": 65000.00
+    }),
+    _BS: MappingProxyType({
+        "account_number_masked": "****1234",
+        "statement_period_start": "2024-07-01",
+        "statement_period_end": "2024-07-31",
+        "opening_balance": 22500.00,
+        "closing_balance": 25000.00,
+        "total_deposits": 8500.00,
+        "total_withdrawals": 6000.00,
+        "transaction_count": 47,
+        "largest_deposit": 5500.00,
+        "average_daily_balance": 23750.00
+    })
+}
+
+
+def _personal_result(document_content: str, document_type: str) -> Dict[str, Any]:
+    """Personal information for one document (see extract_personal_information)"""
     # Demo extraction - in production, this would use sophisticated NLP/LLM extraction
-    demo_data = {
-        DocumentType.DRIVER_LICENSE.value: {
-            "full_name": "John Michael Smith",
-            "date_of_birth": "1985-03-15",
-            "address": "123 Main Street, Anytown, CA 90210",
-            "license_number": "D1234567",
-            "state_issued": "CA",
-            "license_class": "C"
-        },
-        DocumentType.PASSPORT.value: {
-            "full_name": "John Michael Smith",
-            "date_of_birth": "1985-03-15",
-            "passport_number": "123456789",
-            "nationality": "United States",
-            "place_of_birth": "California, USA"
-        }
-    }
-    
-    extracted = demo_data.get(document_type, {})
+    extracted = _thaw(_DEMO_PERSONAL_DATA.get(document_type, _EMPTY_MAPPING))
     
     return {
         "document_type": document_type,
@@ -152,122 +339,142 @@ def extract_personal_information(document_content: str, document_type: str) -> D
         "confidence_score": 0.87,
         "extraction_method": "demo_nlp_extraction",
         "fields_found": len(extracted),
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 
 @client_tool
-def extract_income_information(document_content: str, document_type: str) -> Dict[str, Any]:
+def extract_personal_information(document_content: str, document_type: str) -> Dict[str, Any]:
     """
-    Extract financial and income information from documents.
-    Returns raw financial data without validation.
+    Extract personal information from document content.
+    Returns raw extracted data without validation.
     
     :param document_content: Text content of the document
     :param document_type: Type of document being processed
-    :returns: Raw extracted financial information
+    :returns: Raw extracted personal information
     """
+    return _personal_result(document_content, document_type)
+
+
+def _income_result(document_content: str, document_type: str) -> Dict[str, Any]:
+    """Financial information for one document (see extract_income_information)"""
     # Demo financial extraction
-    demo_financial_data = {
-        DocumentType.PAY_STUB.value: {
-            "gross_pay": 5500.00,
-            "net_pay": 4200.00,
-            "pay_period": "bi-weekly",
-            "pay_date": "2024-07-15",
-            "employer_name": "Tech Solutions Inc",
-            "employee_id": "EMP12345",
-            "ytd_gross": 71500.00,
-            "ytd_taxes": 14300.00,
-            "deductions": {
-                "federal_tax": 825.00,
-                "state_tax": 275.00,
-                "social_security": 341.00,
-                "medicare": 79.75
-            }
-        },
-        DocumentType.TAX_STATEMENT.value: {
-            "tax_year": 2023,
-            "filing_status": "married_filing_jointly",
-            "annual_gross_income": 143000.00,
-            "adjusted_gross_income": 138500.00,
-            "total_tax": 28600.00,
-            "refund_amount": 2100.00,
-            "w2_employers": ["Tech Solutions Inc"],
-            "spouse_income": 65000.00
-        },
-        DocumentType.BANK_STATEMENT.value: {
-            "account_number_masked": "****1234",
-            "statement_period_start": "2024-07-01",
-            "statement_period_end": "2024-07-31",
-            "opening_balance": 22500.00,
-            "closing_balance": 25000.00,
-            "total_deposits": 8500.00,
-            "total_withdrawals": 6000.00,
-            "transaction_count": 47,
-            "largest_deposit": 5500.00,
-            "average_daily_balance": 23750.00
-        }
-    }
-    
-    financial_data = demo_financial_data.get(document_type, {})
+    financial_data = _thaw(_DEMO_FINANCIAL_DATA.get(document_type, _EMPTY_MAPPING))
     
     return {
         "document_type": document_type,
         "financial_information": financial_data,
         "extraction_confidence": 0.91,
         "currency": "USD",
-        "extraction_timestamp": datetime.now().isoformat(),
+        "extraction_timestamp": _now_iso(),
         "data_points_extracted": len(financial_data)
     }
 
 
 @client_tool
-def check_document_quality(document_metadata: Dict[str, Any]) -> Dict[str, Any]:
+def extract_income_information(document_content: str, document_type: str) -> Dict[str, Any]:
     """
-    Extract technical quality metrics from document.
-    Agent will determine quality acceptability using business rules.
+    Extract financial and income information from documents.
+    Returns raw financial data without validation.
     
-    :param document_metadata: Document metadata including file info
-    :returns: Raw quality metrics for agent to evaluate
+    :param document_content: Text content of the document
+    :param document_type: Type of document being processed
+    :returns: Raw extracted financial information
     """
+    return _income_result(document_content, document_type)
+
+
+_BYTES_PER_KB = 1024
+_BYTES_PER_MB = 1024 * 1024
+
+
+def _size_in(file_size: int, unit: int) -> float:
+    """file_size / unit to two decimals using integer math (ties to even, like round())"""
+    hundredths, remainder = divmod(file_size * 100, unit)
+    if remainder * 2 > unit or (remainder * 2 == unit and hundredths & 1):
+        hundredths += 1
+    return hundredths / 100
+
+
+def _quality_result(document_metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Quality metrics for one document (see check_document_quality)"""
     file_size = document_metadata.get("file_size", 0)
     mime_type = document_metadata.get("mime_type", "")
     file_name = document_metadata.get("file_name", "")
     
+    mime_lower = mime_type.lower()
+    
     # Extract raw quality metrics without making decisions
     quality_metrics = {
         "file_size_bytes": file_size,
-        "file_size_mb": round(file_size / (1024 * 1024), 2),
-        "file_size_kb": round(file_size / 1024, 2),
+        "file_size_mb": _size_in(file_size, _BYTES_PER_MB),
+        "file_size_kb": _size_in(file_size, _BYTES_PER_KB),
         "mime_type": mime_type,
         "file_name": file_name,
         "estimated_page_count": 1 if file_size > 0 else 0,
     }
     
     # For PDFs, extract additional metrics
-    if "pdf" in mime_type.lower():
-        quality_metrics.update({
-            "is_pdf": True,
-            "estimated_text_extractable": True,
-            "ocr_required": False
-        })
-    elif "image" in mime_type.lower():
+    if "pdf" in mime_lower:
+        quality_metrics["is_pdf"] = True
+        quality_metrics["estimated_text_extractable"] = True
+        quality_metrics["ocr_required"] = False
+    elif "image" in mime_lower:
         # Simulate OCR confidence for images
         ocr_confidence = 0.88 if file_size > 100000 else 0.65  # Demo logic
-        quality_metrics.update({
-            "is_image": True,
-            "estimated_text_extractable": ocr_confidence > 0.7,
-            "ocr_required": True,
-            "estimated_ocr_confidence": ocr_confidence
-        })
+        quality_metrics["is_image"] = True
+        quality_metrics["estimated_text_extractable"] = ocr_confidence > 0.7
+        quality_metrics["ocr_required"] = True
+        quality_metrics["estimated_ocr_confidence"] = ocr_confidence
     
-    quality_metrics.update({
-        "extraction_timestamp": datetime.now().isoformat(),
-        "analysis_method": "demo_quality_analysis"
-    })
+    quality_metrics["extraction_timestamp"] = _now_iso()
+    quality_metrics["analysis_method"] = "demo_quality_analysis"
     
     return quality_metrics
 
 
+@client_tool
+def check_document_quality(document_metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extract technical quality metrics from document.
+    Agent will determine quality acceptability using business rules.
+    
+    :param document_metadata: Document metadata including file info
+    :returns: Raw quality metrics for agent to evaluate
+    """
+    return _quality_result(document_metadata)
+
+
+@client_tool
+def process_documents_batch(documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Run the per-document tools over a batch of documents in one tool call.
+    Each document is classified, then its dates, personal, income and quality data are extracted.
+    
+    :param documents: Documents with content, file_name and optional mime_type and file_size
+    :returns: Raw classification and extraction results for each document, in input order
+    """
+    timestamp = _now_iso()
+    results = []
+    for document in documents:
+        document_content = document.get("content", "")
+        file_name = document.get("file_name", "")
+    
+        classification = _classification_result(document_content, file_name, timestamp)
+        doc_type = classification["document_type"]
+    
+        results.append({
+            "file_name": file_name,
+            "classification": classification,
+            "expiration": _expiration_result(document_content, doc_type),
+            "personal_information": _personal_result(document_content, doc_type),
+            "income_information": _income_result(document_content, doc_type),
+            "quality": _quality_result(document)
+        })
+    
+    return results
+
+
 @client_tool
 def authorize_credit_check(customer_id: str, authorization_data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -289,7 +496,7 @@ def authorize_credit_check(customer_id: str, authorization_data: Dict[str, Any])
         "authorization_method": authorization_data.get("method", "online_form"),
         "consent_version": authorization_data.get("consent_version", "v1.0"),
         "additional_disclosures": authorization_data.get("additional_disclosures", []),
-        "extraction_timestamp": datetime.now().isoformat()
+        "extraction_timestamp": _now_iso()
     }
     
     return authorization_info
@@ -311,18 +518,27 @@ def generate_urla_1003_form(application_data: Dict[str, Any], extracted_document
     personal_info = {}
     financial_info = {}
     
+    data_sources = []
+    
+    # One pass per document; update() on an empty mapping is a no-op, so no membership tests.
+    # update() merges in C - a {k: v for d in docs for k, v in d.items()} rebuild is slower here.
     for doc in extracted_documents:
-        if "extracted_fields" in doc:
-            personal_info.update(doc["extracted_fields"])
-        if "financial_information" in doc:
-            financial_info.update(doc["financial_information"])
+        personal_info.update(doc.get("extracted_fields") or ())
+        financial_info.update(doc.get("financial_information") or ())
+        data_sources.append(doc.get("document_type"))
+    
+    # Bind the fields used in the form once
+    gross_pay = financial_info.get("gross_pay")
+    closing_balance = financial_info.get("closing_balance")
+    # Customer name is only looked up when no document supplied one
+    full_name = personal_info["full_name"] if "full_name" in personal_info else customer_data.get("name", "")
     
     urla_data = {
-        "form_id": f"URLA_{uuid.uuid4().hex[:8].upper()}",
+        "form_id": f"URLA_{_rand.getrandbits(32):08X}",
         "form_version": "1003_2023",
-        "preparation_date": datetime.now().isoformat(),
+        "preparation_date": _now_iso(),
         "borrower_information": {
-            "name": personal_info.get("full_name", customer_data.get("name", "")),
+            "name": full_name,
             "date_of_birth": personal_info.get("date_of_birth"),
             "ssn": customer_data.get("ssn"),
             "current_address": personal_info.get("address"),
@@ -332,7 +548,7 @@ def generate_urla_1003_form(application_data: Dict[str, Any], extracted_document
         "employment_information": {
             "current_employer": financial_info.get("employer_name"),
             "annual_income": financial_info.get("annual_gross_income"),
-            "monthly_income": financial_info.get("gross_pay", 0) * 26 / 12 if financial_info.get("gross_pay") else None,
+            "monthly_income": gross_pay * 26 / 12 if gross_pay else None,
             "employment_years": "2+",  # Demo value
             "job_title": "Software Engineer"  # Demo value
         },
@@ -344,12 +560,12 @@ def generate_urla_1003_form(application_data: Dict[str, Any], extracted_document
             "property_address": "456 Property Lane, Hometown, CA 90210"
         },
         "assets_and_liabilities": {
-            "checking_account_balance": financial_info.get("closing_balance"),
+            "checking_account_balance": closing_balance,
             "savings_account_balance": 15000,  # Demo value
-            "total_assets": financial_info.get("closing_balance", 0) + 15000,
+            "total_assets": (closing_balance or 0) + 15000,
             "monthly_debt_payments": 850  # Demo value
         },
-        "data_sources": [doc.get("document_type") for doc in extracted_documents],
+        "data_sources": data_sources,
         "completion_status": "draft",
         "requires_review": True
     }
@@ -359,7 +575,7 @@ def generate_urla_1003_form(application_data: Dict[str, Any], extracted_document
         "form_completeness": 0.85,  # Demo percentage
         "missing_fields": ["spouse_information", "co_borrower_details"],
         "data_confidence": 0.88,
-        "generation_timestamp": datetime.now().isoformat(),
+        "generation_timestamp": _now_iso(),
         "ready_for_submission": False
     }
 
@@ -386,40 +602,50 @@ def cross_validate_documents(documents_data: List[Dict[str, Any]]) -> Dict[str,
     income_sources = []
     dates_found = []
     
+    # Consistency is tracked while collecting: None until a value is seen,
+    # then True until a value differs from the first one found
+    name_consistency = address_consistency = employment_consistency = None
+    
     for doc_data in documents_data:
-        # Extract names from various document types
-        if "extracted_fields" in doc_data:
-            fields = doc_data["extracted_fields"]
-            if "full_name" in fields:
-                names_found.append(fields["full_name"])
-            if "address" in fields:
-                addresses_found.append(fields["address"])
-                
-        # Extract income information
-        if "financial_information" in doc_data:
-            fin_info = doc_data["financial_information"]
-            if "employer_name" in fin_info:
-                income_sources.append(fin_info["employer_name"])
-                
-        # Extract dates
-        if "expiration_date" in doc_data and doc_data["expiration_date"]:
-            dates_found.append(doc_data["expiration_date"])
+        # Pull every comparable field in one walk over the document
+        fields = doc_data.get("extracted_fields") or {}
+        fin_info = doc_data.get("financial_information") or {}
+        
+        if "full_name" in fields:
+            name = fields["full_name"]
+            names_found.append(name)
+            name_consistency = name == names_found[0] and name_consistency is not False
+        if "address" in fields:
+            address = fields["address"]
+            addresses_found.append(address)
+            address_consistency = address == addresses_found[0] and address_consistency is not False
+        if "employer_name" in fin_info:
+            employer = fin_info["employer_name"]
+            income_sources.append(employer)
+            employment_consistency = employer == income_sources[0] and employment_consistency is not False
+        expiration_date = doc_data.get("expiration_date")
+        if expiration_date:
+            dates_found.append(expiration_date)
     
     return {
         "cross_reference_possible": True,
         "document_count": len(documents_data),
         "names_found": names_found,
-        "name_consistency": len(set(names_found)) <= 1 if names_found else None,
+        "name_consistency": name_consistency,
         "addresses_found": addresses_found,
-        "address_consistency": len(set(addresses_found)) <= 1 if addresses_found else None,
+        "address_consistency": address_consistency,
         "income_sources": income_sources,
-        "employment_consistency": len(set(income_sources)) <= 1 if income_sources else None,
+        "employment_consistency": employment_consistency,
         "dates_extracted": dates_found,
-        "analysis_timestamp": datetime.now().isoformat(),
+        "analysis_timestamp": _now_iso(),
         "comparison_method": "demo_cross_reference"
     }
 
 
+# get_current_date_time response, rebuilt at most once per second
+_dt_cache = [-1, None]
+
+
 @client_tool
 def get_current_date_time() -> Dict[str, Any]:
     """
@@ -428,18 +654,21 @@ def get_current_date_time() -> Dict[str, Any]:
     
     :returns: Current date and time information
     """
-    now = datetime.now()
-    today = date.today()
-    
-    return {
-        "current_datetime": now.isoformat(),
-        "current_date": today.isoformat(),
-        "current_year": today.year,
-        "current_month": today.month,
-        "current_day": today.day,
-        "timezone": "UTC",
-        "timestamp": now.isoformat()
-    }
+    now = int(time.time())
+    if now != _dt_cache[0]:
+        current = datetime.fromtimestamp(now)
+        current_iso = current.isoformat()
+        _dt_cache[:] = [now, {
+            "current_datetime": current_iso,
+            "current_date": current_iso[:10],
+            "current_year": current.year,
+            "current_month": current.month,
+            "current_day": current.day,
+            "timezone": "UTC",
+            "timestamp": current_iso
+        }]
+    
+    return _dt_cache[1].copy()
 
 
 # ============================================================================
@@ -448,6 +677,80 @@ def get_current_date_time() -> Dict[str, Any]:
 
 from pydantic import BaseModel, Field
 
+# Extraction patterns compiled once at import. Patterns that open with a character-class
+# run are anchored with a lookbehind to the start of that run: the leftmost match always
+# begins there anyway, and it stops re.search from rescanning the run from every offset
+# (quadratic on long unbroken text).
+_NAME_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"(?:my name is|i'm|i am|call me)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)",
+    r"(?<![A-Za-z])([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)"
+))
+_PHONE_RE = re.compile(r"(\(?(?:\d{3})\)?[-.\s]?\d{3}[-.\s]?\d{4})")
+_EMAIL_RE = re.compile(r"(?<![a-zA-Z0-9._%+-])([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})")
+# Income patterns in priority order: the first with an in-range match wins
+_INCOME_RES = (
+    re.compile(r"(\d{5,7})"),  # 5-7 digit numbers likely to be income
+    re.compile(r"\$?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)")
+)
+_EMPLOYER_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"work(?:\s+at|\s+for)\s+([A-Z][a-zA-Z\s&.,]+?)(?:\s|,|$)",
+    r"employed\s+(?:at|by)\s+([A-Z][a-zA-Z\s&.,]+?)(?:\s|,|$)",
+    r"company\s+(?:called|named)\s+([A-Z][a-zA-Z\s&.,]+?)(?:\s|,|$)"
+))
+_PRICE_RE = re.compile(r"\$?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)")
+_LOCATION_RES = (
+    re.compile(r"(?<![A-Za-z\s])([A-Za-z\s]+,\s*[A-Z]{2})"),
+    re.compile(r"(?<![A-Za-z\s])([A-Za-z\s]+),\s*([A-Za-z\s]+)")
+)
+_CREDIT_RE = re.compile(r"(\d{3})")
+_DOWN_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"(?:down|put down)\s*(?:payment)?\s*(?:of\s*)?\$?(\d{1,3}(?:,\d{3})*)",
+    r"\$(\d{1,3}(?:,\d{3})*)\s*(?:down|as\s+down)"
+))
+_AMOUNT_RE = re.compile(r"\$?(\d{1,3}(?:,\d{3})*)")
+
+# Employment type synonyms in priority order: (canonical type, terms)
+_EMPLOYMENT_TYPE_RULES = (
+    ("full-time", ("full time", "full-time", "fulltime")),
+    ("part-time", ("part time", "part-time", "parttime")),
+    ("contractor", ("contractor", "freelance", "consultant")),
+    ("self-employed", ("self employed", "self-employed", "own business")),
+)
+
+
+def _first_in_range(pattern: re.Pattern, text: str, low: float, high: float, parse=int) -> Optional[float]:
+    """
+    First pattern match in text (group 1, commas stripped, converted with parse) within [low, high].
+    Streams matches with finditer so scanning stops at the first hit. Returns None if nothing fits.
+    Patterns only capture digits, commas and a decimal point, so parse never sees malformed input.
+    """
+    for match in pattern.finditer(text):
+        value = parse(match.group(1).replace(",", ""))
+        if low <= value <= high:
+            return value
+    return None
+
+
+def _memoize_extraction(func):
+    """
+    Cache a pure text -> dict extractor so repeated chat turns skip the regex work.
+    Callers get a shallow copy, so the cached result can't be mutated.
+    """
+    cached = functools.lru_cache(maxsize=256)(func)
+    
+    @functools.wraps(func)
+    def wrapper(text: str) -> Dict[str, Any]:
+        return dict(cached(text))
+    
+    return wrapper
+
+
+# Known employers as (lowercase, canonical) pairs, checked in order
+_KNOWN_COMPANIES = tuple((company.lower(), company) for company in (
+    "IBM", "Google", "Microsoft", "Apple", "Amazon", "Meta", "Tesla",
+    "Wells Fargo", "Bank of America", "Chase", "Citibank"
+))
+
 class PersonalInfoSchema(BaseModel):
     """Schema for extracting personal information from mortgage applicant text"""
     text: str = Field(
@@ -455,6 +758,7 @@ class PersonalInfoSchema(BaseModel):
     )
 
 @tool("extract_personal_info", args_schema=PersonalInfoSchema, parse_docstring=True)
+@_memoize_extraction
 def extract_personal_info(text: str) -> Dict[str, Any]:
     """Extract personal information from mortgage applicant's message.
     
@@ -467,28 +771,28 @@ def extract_personal_info(text: str) -> Dict[str, Any]:
     Returns:
         Dictionary with extracted personal information fields
     """
+    # Nothing to extract from empty or whitespace-only turns
+    if not text or text.isspace():
+        return {}
+    
     data = {}
     
     # Name extraction with improved patterns
-    name_patterns = [
-        r"(?:my name is|i'm|i am|call me)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)",
-        r"([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)"
-    ]
-    for pattern in name_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _NAME_PATTERNS:
+        match = pattern.search(text)
         if match:
             data["full_name"] = match.group(1).strip()
             break
     
     # Phone extraction with validation
-    phone_match = re.search(r"(\(?(?:\d{3})\)?[-.\s]?\d{3}[-.\s]?\d{4})", text)
+    phone_match = _PHONE_RE.search(text)
     if phone_match:
-        cleaned = re.sub(r'[^\d]', '', phone_match.group(1))
+        cleaned = "".join(filter(str.isdecimal, phone_match.group(1)))  # Same class as \d
         if len(cleaned) == 10:
             data["phone"] = f"{cleaned[:3]}-{cleaned[3:6]}-{cleaned[6:]}"
     
     # Email extraction with validation
-    email_match = re.search(r"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})", text)
+    email_match = _EMAIL_RE.search(text)
     if email_match:
         data["email"] = email_match.group(1).lower()
     
@@ -501,6 +805,7 @@ class EmploymentInfoSchema(BaseModel):
     )
 
 @tool("extract_employment_info", args_schema=EmploymentInfoSchema, parse_docstring=True)
+@_memoize_extraction
 def extract_employment_info(text: str) -> Dict[str, Any]:
     """Extract employment information from mortgage applicant's message.
     
@@ -516,45 +821,30 @@ def extract_employment_info(text: str) -> Dict[str, Any]:
         - employer: Company or organization name  
         - employment_type: Type of employment (full-time, part-time, contractor, self-employed)
     """
+    if not text or text.isspace():
+        return {}
+    
     data = {}
+    text_lower = text.lower()
     
     # Income extraction with improved validation
-    income_patterns = [
-        r"\$?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)",
-        r"(\d{5,7})"  # 5-7 digit numbers likely to be income
-    ]
-    for pattern in income_patterns:
-        matches = re.findall(pattern, text)
-        for match in matches:
-            if isinstance(match, tuple):
-                match = match[0] if match[0] else match[1]
-            amount = match.replace(",", "")
-            try:
-                income_val = int(float(amount))
-                # Validate income is in reasonable range for mortgage applicants
-                if 10000 <= income_val <= 2000000:
-                    data["annual_income"] = income_val
-                    break
-            except:
-                continue
+    for pattern in _INCOME_RES:
+        # Validate income is in reasonable range for mortgage applicants
+        income_val = _first_in_range(pattern, text, 10000, 2000000, lambda amount: int(float(amount)))
+        if income_val is not None:
+            data["annual_income"] = income_val
+            break
     
     # Employer extraction with enhanced patterns
-    known_companies = ["IBM", "Google", "Microsoft", "Apple", "Amazon", "Meta", "Tesla", 
-                      "Wells Fargo", "Bank of America", "Chase", "Citibank"]
-    for company in known_companies:
-        if company.lower() in text.lower():
+    for company_lower, company in _KNOWN_COMPANIES:
+        if company_lower in text_lower:
             data["employer"] = company
             break
     
     # Generic employer patterns with better validation
     if "employer" not in data:
-        employer_patterns = [
-            r"work(?:\s+at|\s+for)\s+([A-Z][a-zA-Z\s&.,]+?)(?:\s|,|$)",
-            r"employed\s+(?:at|by)\s+([A-Z][a-zA-Z\s&.,]+?)(?:\s|,|$)",
-            r"company\s+(?:called|named)\s+([A-Z][a-zA-Z\s&.,]+?)(?:\s|,|$)"
-        ]
-        for pattern in employer_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _EMPLOYER_RES:
+            match = pattern.search(text)
             if match:
                 employer = match.group(1).strip()
                 if len(employer) > 2 and len(employer) < 50:  # Reasonable company name length
@@ -562,51 +852,39 @@ def extract_employment_info(text: str) -> Dict[str, Any]:
                     break
     
     # Employment type classification
-    if any(term in text.lower() for term in ["full time", "full-time", "fulltime"]):
-        data["employment_type"] = "full-time"
-    elif any(term in text.lower() for term in ["part time", "part-time", "parttime"]):
-        data["employment_type"] = "part-time"
-    elif any(term in text.lower() for term in ["contractor", "freelance", "consultant"]):
-        data["employment_type"] = "contractor"
-    elif any(term in text.lower() for term in ["self employed", "self-employed", "own business"]):
-        data["employment_type"] = "self-employed"
+    for employment_type, terms in _EMPLOYMENT_TYPE_RULES:
+        if any(term in text_lower for term in terms):
+            data["employment_type"] = employment_type
+            break
     
     return data
 
 @tool
+@_memoize_extraction
 def extract_property_info(text: str) -> Dict[str, Any]:
     """Extract property information from user input"""
+    if not text or text.isspace():
+        return {}
+    
     data = {}
     
     # Price extraction
-    price_patterns = [r"\$?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)"]
-    for pattern in price_patterns:
-        matches = re.findall(pattern, text)
-        for match in matches:
-            amount = match.replace(",", "")
-            try:
-                num_amount = float(amount)
-                if 50000 <= num_amount <= 50000000:
-                    data["purchase_price"] = int(num_amount)
-                    break
-            except:
-                continue
+    num_amount = _first_in_range(_PRICE_RE, text, 50000, 50000000, float)
+    if num_amount is not None:
+        data["purchase_price"] = int(num_amount)
     
     # Property type
-    if any(word in text.lower() for word in ["house", "home", "single family"]):
+    text_lower = text.lower()
+    if any(word in text_lower for word in ("house", "home", "single family")):
         data["property_type"] = "single_family"
-    elif any(word in text.lower() for word in ["condo", "condominium"]):
+    elif any(word in text_lower for word in ("condo", "condominium")):
         data["property_type"] = "condo"
-    elif any(word in text.lower() for word in ["townhouse", "townhome"]):
+    elif any(word in text_lower for word in ("townhouse", "townhome")):
         data["property_type"] = "townhouse"
     
     # Location extraction
-    location_patterns = [
-        r"([A-Za-z\s]+,\s*[A-Z]{2})",
-        r"([A-Za-z\s]+),\s*([A-Za-z\s]+)"
-    ]
-    for pattern in location_patterns:
-        match = re.search(pattern, text)
+    for pattern in _LOCATION_RES:
+        match = pattern.search(text)
         if match:
             if len(match.groups()) == 1:
                 data["property_location"] = match.group(1).strip()
@@ -617,25 +895,22 @@ def extract_property_info(text: str) -> Dict[str, Any]:
     return data
 
 @tool
+@_memoize_extraction
 def extract_financial_info(text: str) -> Dict[str, Any]:
     """Extract financial information from user input"""
+    if not text or text.isspace():
+        return {}
+    
     data = {}
     
     # Credit score (3-digit number between 300-850)
-    credit_matches = re.findall(r"(\d{3})", text)
-    for match in credit_matches:
-        score = int(match)
-        if 300 <= score <= 850:
-            data["credit_score"] = score
-            break
+    score = _first_in_range(_CREDIT_RE, text, 300, 850)
+    if score is not None:
+        data["credit_score"] = score
     
     # Down payment
-    down_patterns = [
-        r"(?:down|put down)\s*(?:payment)?\s*(?:of\s*)?\$?(\d{1,3}(?:,\d{3})*)",
-        r"\$(\d{1,3}(?:,\d{3})*)\s*(?:down|as\s+down)"
-    ]
-    for pattern in down_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _DOWN_RES:
+        match = pattern.search(text)
         if match:
             amount = int(match.group(1).replace(",", ""))
             if amount >= 1000:
@@ -644,15 +919,9 @@ def extract_financial_info(text: str) -> Dict[str, Any]:
     
     # If no explicit down payment mentioned, look for large dollar amounts
     if "down_payment" not in data:
-        amounts = re.findall(r"\$?(\d{1,3}(?:,\d{3})*)", text)
-        for amount_str in amounts:
-            try:
-                amount = int(amount_str.replace(",", ""))
-                if 5000 <= amount <= 500000:  # Reasonable down payment range
-                    data["down_payment"] = amount
-                    break
-            except:
-                continue
+        amount = _first_in_range(_AMOUNT_RE, text, 5000, 500000)  # Reasonable down payment range
+        if amount is not None:
+            data["down_payment"] = amount
     
     return data
 
@@ -735,39 +1004,38 @@ def submit_application_to_database(application_data: str) -> str:
             
         else:
             # Fallback - shouldn't happen with FINAL_SUBMISSION intent
-            application_id = f"APP_{datetime.now().strftime('%Y%m%d')}_{uuid.uuid4().hex[:8].upper()}"
+            application_id = f"APP_{_today_iso().replace('-', '')}_{secrets.token_hex(4).upper()}"
             logger.warning(f"Fallback application creation: {application_id}")
         
         # Calculate completion percentage
         completion_percentage = 100.0
         
-        # Store in database
-        with get_db_session() as db:
-            db_application = MortgageApplicationDB(
-                application_id=application_id,
-                session_id=session_id,
-                full_name=full_name,
-                phone=phone,
-                email=email,
-                annual_income=annual_income,
-                employer=employer,
-                employment_type=employment_type,
-                purchase_price=purchase_price,
-                property_type=property_type,
-                property_location=property_location,
-                down_payment=down_payment,
-                credit_score=credit_score,
-                status="submitted",
-                completion_percentage=completion_percentage,
-                next_steps=[
-                    "Application review in progress",
-                    "Document verification",
-                    "Credit check authorization",
-                    "Property appraisal scheduling"
-                ]
-            )
-            db.add(db_application)
-            db.commit()
+        # Store in database (SQLAlchemy is only loaded once a DB tool actually runs)
+        from ..database import save_application, MortgageApplicationDB
+        db_application = MortgageApplicationDB(
+            application_id=application_id,
+            session_id=session_id,
+            full_name=full_name,
+            phone=phone,
+            email=email,
+            annual_income=annual_income,
+            employer=employer,
+            employment_type=employment_type,
+            purchase_price=purchase_price,
+            property_type=property_type,
+            property_location=property_location,
+            down_payment=down_payment,
+            credit_score=credit_score,
+            status="submitted",
+            completion_percentage=completion_percentage,
+            next_steps=[
+                "Application review in progress",
+                "Document verification",
+                "Credit check authorization",
+                "Property appraisal scheduling"
+            ]
+        )
+        save_application(db_application)
         
         logger.info(f"Application {application_id} submitted successfully for session {session_id}")
         
@@ -781,15 +1049,34 @@ def submit_application_to_database(application_data: str) -> str:
                f"You can reference your application using ID: **{application_id}**\n\n" \
                f"Is there anything else I can help you with regarding your mortgage application?"
     
-    except Exception as e:
-        logger.error(f"Error submitting application: {str(e)}")
-        return f" I apologize, but there was an issue submitting your application: {str(e)}. " \
+    except ValueError as e:
+        # Malformed numeric fields: the message is safe to show and helps the agent correct the input
+        logger.warning(f"Invalid application data: {e}")
+        return f" I apologize, but there was an issue submitting your application: {e}. " \
+               f"Please try again in a moment, or let me know if you need assistance."
+    
+    except Exception:
+        # Database and lifecycle errors can embed SQL and customer data, so only a reference is shown
+        error_ref = secrets.token_hex(4).upper()
+        logger.exception(f"Error submitting application [ref {error_ref}]")
+        return f" I apologize, but there was an issue submitting your application (reference {error_ref}). " \
                f"Please try again in a moment, or let me know if you need assistance."
 
 class ApplicationStatusSchema(BaseModel):
     """Schema for checking application status"""
     application_id: str = Field(description="Application ID to check status for")
 
+# Status reply filled in one pass; next steps and notes are optional blocks
+_STATUS_TEMPLATE = (
+    "📋 **Application Status for {application_id}**\n\n"
+    "• **Status**: {status}\n"
+    "• **Completion**: {completion:.1f}%\n"
+    "• **Submitted**: {submitted}\n"
+    "• **Last Updated**: {updated}\n\n"
+    "{next_steps}{notes}"
+    "Is there anything specific about your application you'd like to know more about?"
+)
+
 @tool("check_application_status", args_schema=ApplicationStatusSchema, parse_docstring=True)
 def check_application_status(application_id: str) -> str:
     """Check the status of a submitted mortgage application.
@@ -803,39 +1090,39 @@ def check_application_status(application_id: str) -> str:
     Returns:
         Application status information or error message
     """
+    from ..database import get_db_session, get_application
+    
     try:
         with get_db_session() as db:
-            app = db.query(MortgageApplicationDB).filter(
-                MortgageApplicationDB.application_id == application_id
-            ).first()
+            app = get_application(db, application_id)
             
             if not app:
                 return f" No application found with ID: {application_id}. " \
                        f"Please double-check the application ID and try again."
             
             # Format status information
-            status_info = f"📋 **Application Status for {application_id}**\n\n" \
-                         f"• **Status**: {app.status.title()}\n" \
-                         f"• **Completion**: {app.completion_percentage:.1f}%\n" \
-                         f"• **Submitted**: {app.submitted_at.strftime('%B %d, %Y at %I:%M %p')}\n" \
-                         f"• **Last Updated**: {app.updated_at.strftime('%B %d, %Y at %I:%M %p')}\n\n"
-            
+            next_steps = ""
             if app.next_steps:
-                status_info += "**Next Steps:**\n"
-                for i, step in enumerate(app.next_steps, 1):
-                    status_info += f"{i}. {step}\n"
-                status_info += "\n"
+                next_steps = "**Next Steps:**\n" + "".join(
+                    f"{i}. {step}\n" for i, step in enumerate(app.next_steps, 1)
+                ) + "\n"
             
-            if app.processing_notes:
-                status_info += f"**Processing Notes**: {app.processing_notes}\n\n"
-                
-            status_info += "Is there anything specific about your application you'd like to know more about?"
+            notes = f"**Processing Notes**: {app.processing_notes}\n\n" if app.processing_notes else ""
             
-            return status_info
+            return _STATUS_TEMPLATE.format(
+                application_id=application_id,
+                status=app.status.title(),
+                completion=app.completion_percentage,
+                submitted=app.submitted_at.strftime('%B %d, %Y at %I:%M %p'),
+                updated=app.updated_at.strftime('%B %d, %Y at %I:%M %p'),
+                next_steps=next_steps,
+                notes=notes
+            )
     
-    except Exception as e:
-        logger.error(f"Error checking application status: {str(e)}")
-        return f" There was an error checking the application status: {str(e)}. " \
+    except Exception:
+        error_ref = secrets.token_hex(4).upper()
+        logger.exception(f"Error checking application status [ref {error_ref}]")
+        return f" There was an error checking the application status (reference {error_ref}). " \
                f"Please try again or contact support if the issue persists."
 
 
@@ -843,6 +1130,47 @@ def check_application_status(application_id: str) -> str:
 # REACT AGENT TOOLS - Dynamic UI and Prompt Generation
 # =============================================================================
 
+# Prompt rows are constant; each group is offered when any of its fields is missing
+_FIELD_PROMPT_GROUPS = (
+    (frozenset({"full_name", "phone", "email"}), (
+        MappingProxyType({"text": "I'll provide my personal information", "icon": "👤", "category": "personal"}),
+        MappingProxyType({"text": "My name is [enter your name]", "icon": "📝", "category": "personal"}),
+        MappingProxyType({"text": "My phone number is [enter phone]", "icon": "📞", "category": "personal"}),
+        MappingProxyType({"text": "My email is [enter email]", "icon": "📧", "category": "personal"})
+    )),
+    (frozenset({"annual_income", "employer"}), (
+        MappingProxyType({"text": "I'll share my employment details", "icon": "💼", "category": "employment"}),
+        MappingProxyType({"text": "My annual income is $[amount]", "icon": "💰", "category": "employment"}),
+        MappingProxyType({"text": "I work at [company name]", "icon": "🏢", "category": "employment"}),
+        MappingProxyType({"text": "I'm self-employed", "icon": "👨‍💼", "category": "employment"})
+    )),
+    (frozenset({"purchase_price", "property_type"}), (
+        MappingProxyType({"text": "Let me tell you about the property", "icon": "🏠", "category": "property"}),
+        MappingProxyType({"text": "The purchase price is $[amount]", "icon": "🏷️", "category": "property"}),
+        MappingProxyType({"text": "It's a single-family home", "icon": "🏡", "category": "property"}),
+        MappingProxyType({"text": "It's a condominium", "icon": "🏢", "category": "property"})
+    )),
+    (frozenset({"down_payment", "credit_score"}), (
+        MappingProxyType({"text": "I'll provide financial information", "icon": "📊", "category": "financial"}),
+        MappingProxyType({"text": "My down payment will be $[amount]", "icon": "💳", "category": "financial"}),
+        MappingProxyType({"text": "My credit score is [score]", "icon": "📈", "category": "financial"}),
+        MappingProxyType({"text": "I need help calculating down payment", "icon": "🧮", "category": "financial"})
+    ))
+)
+
+# Helpful prompts added for the current phase
+_PHASE_PROMPTS = {
+    "initial": (
+        MappingProxyType({"text": "I'm ready to start my application", "icon": "🚀", "category": "action"}),
+        MappingProxyType({"text": "What information do you need from me?", "icon": "❓", "category": "help"})
+    ),
+    "data_collection": (
+        MappingProxyType({"text": "What else do you need to know?", "icon": "❓", "category": "help"}),
+        MappingProxyType({"text": "Can you check what's missing?", "icon": "🔍", "category": "help"})
+    )
+}
+
+
 @tool
 def generate_contextual_prompts(current_phase: str, collected_data: str, missing_fields: str) -> Dict[str, Any]:
     """
@@ -856,61 +1184,22 @@ def generate_contextual_prompts(current_phase: str, collected_data: str, missing
     Returns:
         Dict with prompts structure for frontend
     """
-    import json
-    
     try:
-        collected = json.loads(collected_data) if collected_data else {}
+        collected = _json_loads(collected_data) if collected_data else {}
     except:
         collected = {}
     
-    missing_list = [f.strip() for f in missing_fields.split(',') if f.strip()]
+    missing = {field.strip() for field in missing_fields.split(',')}
     
     prompts = []
     
     # Generate prompts based on missing fields and current phase
-    if 'full_name' in missing_list or 'phone' in missing_list or 'email' in missing_list:
-        prompts.extend([
-            {"text": "I'll provide my personal information", "icon": "👤", "category": "personal"},
-            {"text": "My name is [enter your name]", "icon": "📝", "category": "personal"},
-            {"text": "My phone number is [enter phone]", "icon": "📞", "category": "personal"},
-            {"text": "My email is [enter email]", "icon": "📧", "category": "personal"}
-        ])
-    
-    if 'annual_income' in missing_list or 'employer' in missing_list:
-        prompts.extend([
-            {"text": "I'll share my employment details", "icon": "💼", "category": "employment"},
-            {"text": "My annual income is $[amount]", "icon": "💰", "category": "employment"},
-            {"text": "I work at [company name]", "icon": "🏢", "category": "employment"},
-            {"text": "I'm self-employed", "icon": "👨‍💼", "category": "employment"}
-        ])
-    
-    if 'purchase_price' in missing_list or 'property_type' in missing_list:
-        prompts.extend([
-            {"text": "Let me tell you about the property", "icon": "🏠", "category": "property"},
-            {"text": "The purchase price is $[amount]", "icon": "🏷️", "category": "property"},
-            {"text": "It's a single-family home", "icon": "🏡", "category": "property"},
-            {"text": "It's a condominium", "icon": "🏢", "category": "property"}
-        ])
-    
-    if 'down_payment' in missing_list or 'credit_score' in missing_list:
-        prompts.extend([
-            {"text": "I'll provide financial information", "icon": "📊", "category": "financial"},
-            {"text": "My down payment will be $[amount]", "icon": "💳", "category": "financial"},
-            {"text": "My credit score is [score]", "icon": "📈", "category": "financial"},
-            {"text": "I need help calculating down payment", "icon": "🧮", "category": "financial"}
-        ])
+    for fields, group_prompts in _FIELD_PROMPT_GROUPS:
+        if not missing.isdisjoint(fields):
+            prompts.extend(map(dict, group_prompts))
     
     # Add helpful prompts based on current phase
-    if current_phase == 'initial':
-        prompts.extend([
-            {"text": "I'm ready to start my application", "icon": "🚀", "category": "action"},
-            {"text": "What information do you need from me?", "icon": "❓", "category": "help"}
-        ])
-    elif current_phase == 'data_collection':
-        prompts.extend([
-            {"text": "What else do you need to know?", "icon": "❓", "category": "help"},
-            {"text": "Can you check what's missing?", "icon": "🔍", "category": "help"}
-        ])
+    prompts.extend(map(dict, _PHASE_PROMPTS.get(current_phase, ())))
     
     return {
         "type": "dynamic_prompts",
@@ -919,6 +1208,53 @@ def generate_contextual_prompts(current_phase: str, collected_data: str, missing
         "completion_status": f"{len(collected)}/11 fields collected"
     }
 
+
+# Guidance tiers: _GUIDANCE_TIERS[i] applies below _GUIDANCE_THRESHOLDS[i], the last one above them all
+_GUIDANCE_THRESHOLDS = (0.3, 0.6, 0.8)
+_GUIDANCE_TIERS = (
+    MappingProxyType({
+        "type": "guidance",
+        "message": "Let's start with your basic information - name, phone, and email.",
+        "priority": "high",
+        "suggestions": (
+            "Share your full name",
+            "Provide your phone number",
+            "Give us your email address"
+        )
+    }),
+    MappingProxyType({
+        "type": "guidance",
+        "message": "Great progress! Now let's get your employment and income details.",
+        "priority": "medium",
+        "suggestions": (
+            "Tell us about your employer",
+            "Share your annual income",
+            "Mention your employment type"
+        )
+    }),
+    MappingProxyType({
+        "type": "guidance",
+        "message": "Almost there! We need property and financial information.",
+        "priority": "medium",
+        "suggestions": (
+            "Share the property purchase price",
+            "Tell us the property type",
+            "Provide your down payment amount"
+        )
+    }),
+    MappingProxyType({
+        "type": "guidance",
+        "message": "Excellent! Your application is nearly complete. Just a few final details.",
+        "priority": "low",
+        "suggestions": (
+            "Review your information",
+            "Submit your application",
+            "Schedule next steps"
+        )
+    })
+)
+
+
 @tool  
 def generate_next_step_guidance(current_state: str, completion_percentage: float) -> Dict[str, Any]:
     """
@@ -931,57 +1267,9 @@ def generate_next_step_guidance(current_state: str, completion_percentage: float
     Returns:
         Dict with next step guidance for user
     """
-    import json
-    
-    try:
-        state = json.loads(current_state) if current_state else {}
-    except:
-        state = {}
-    
-    if completion_percentage < 0.3:
-        return {
-            "type": "guidance",
-            "message": "Let's start with your basic information - name, phone, and email.",
-            "priority": "high",
-            "suggestions": [
-                "Share your full name",
-                "Provide your phone number", 
-                "Give us your email address"
-            ]
-        }
-    elif completion_percentage < 0.6:
-        return {
-            "type": "guidance", 
-            "message": "Great progress! Now let's get your employment and income details.",
-            "priority": "medium",
-            "suggestions": [
-                "Tell us about your employer",
-                "Share your annual income",
-                "Mention your employment type"
-            ]
-        }
-    elif completion_percentage < 0.8:
-        return {
-            "type": "guidance",
-            "message": "Almost there! We need property and financial information.",
-            "priority": "medium", 
-            "suggestions": [
-                "Share the property purchase price",
-                "Tell us the property type",
-                "Provide your down payment amount"
-            ]
-        }
-    else:
-        return {
-            "type": "guidance",
-            "message": "Excellent! Your application is nearly complete. Just a few final details.",
-            "priority": "low",
-            "suggestions": [
-                "Review your information",
-                "Submit your application",
-                "Schedule next steps"
-            ]
-        }
+    # Guidance depends only on progress, so current_state is accepted but not parsed
+    tier = _GUIDANCE_TIERS[bisect.bisect_right(_GUIDANCE_THRESHOLDS, completion_percentage)]
+    return {**tier, "suggestions": list(tier["suggestions"])}
 
 
 # =============================================================================
@@ -1027,7 +1315,7 @@ def calculate_debt_to_income_ratio(monthly_income: float, monthly_debts: float)
             "Consider debt reduction to improve qualification" if dti_ratio > 43 else
             "DTI within acceptable range"
         ],
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 @tool
@@ -1072,7 +1360,7 @@ def calculate_loan_to_value_ratio(loan_amount: float, property_value: float) ->
             "usda": "Qualified" if ltv_ratio <= 100 else "Not Qualified"
         },
         "risk_assessment": "Low Risk" if ltv_ratio <= 80 else "Moderate Risk" if ltv_ratio <= 90 else "Higher Risk",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 @tool
@@ -1119,7 +1407,7 @@ def calculate_monthly_payment(loan_amount: float, interest_rate: float, loan_ter
             "estimated_insurance": round(loan_amount * 0.003 / 12, 2),     # 0.3% annually
             "estimated_hoa": 150  # Default HOA estimate
         },
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 @tool
@@ -1221,7 +1509,7 @@ def assess_affordability(annual_income: float, monthly_debts: float, down_paymen
             "Increase down payment to reduce monthly costs" if pmi_monthly > 0 else "Great down payment amount",
             f"Your debt-to-income ratio is {qualification_level.lower()}"
         ],
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 @tool
@@ -1323,7 +1611,7 @@ def check_loan_program_eligibility(annual_income: float, credit_score: int, down
             "Save for larger down payment",
             "Consider FHA loan options"
         ],
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 @tool
@@ -1434,7 +1722,7 @@ def generate_pre_approval_assessment(annual_income: float, monthly_debts: float,
             "Subject to property appraisal",
             "Subject to final underwriting approval"
         ],
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 
@@ -1516,7 +1804,7 @@ def simulate_credit_check(ssn_last_4: str, full_name: str, date_of_birth: str,
             "credit_score": credit_score,
             "score_range": "300-850",
             "credit_tier": tier,
-            "report_date": datetime.now().isoformat(),
+            "report_date": _now_iso(),
             "bureau": "Demo Credit Bureau"
         },
         "score_factors": {
@@ -1553,7 +1841,7 @@ def simulate_credit_check(ssn_last_4: str, full_name: str, date_of_birth: str,
             "Standard pre-approval process" if credit_score >= 620 else
             "Work on credit improvement before applying"
         ],
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 @tool
@@ -1646,7 +1934,7 @@ def verify_employment_history(employer_name: str, job_title: str, employment_yea
         "verification_summary": {
             "verification_successful": verification_successful,
             "verification_method": verification_method,
-            "verification_date": datetime.now().isoformat(),
+            "verification_date": _now_iso(),
             "hr_contact_confirmed": hr_phone is not None
         },
         "employment_details": employment_details,
@@ -1678,7 +1966,7 @@ def verify_employment_history(employer_name: str, job_title: str, employment_yea
             f"Employment type ({employment_type}) is {'well-suited' if employment_type == 'full-time' else 'acceptable'} for mortgage lending",
             f"Industry stability is {'strong' if any(industry in employer_name.lower() for industry in stable_industries) else 'standard'}"
         ],
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 @tool
@@ -1819,7 +2107,7 @@ def validate_income_sources(primary_income: float, secondary_income: float = 0,
             "Consider investment income volatility in loan planning" if investment_income > 0 else None,
             "Rental income adds qualification strength with proper documentation" if rental_income > 0 else None
         ],
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 @tool
@@ -1947,5 +2235,5 @@ def analyze_bank_statements(account_type: str, average_balance: float, deposit_f
             "Source of funds documentation" if average_balance >= 50000 else None,
             "Gift letter if applicable" if any(dep > 10000 for dep in large_deposits) else None
         ],
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
\ No newline at end of file